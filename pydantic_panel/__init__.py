@@ -54,16 +54,48 @@ from .widgets import (
     ItemDictEditor,
 )
 
+from .hints import Hint
+
+from .readonly import ReadOnlyView
+
+from .scalars import ScalarDictEditor, ScalarListEditor, ScalarTupleEditor
+
+from .shared import SharedModel
+
+from .changes import ChangeEvent, ChangeStream
+
+from .state import FormState, ListState, DictState
+
+from .text import LargeTextEditor
+
+from .traffic import TrafficRecord
+
+from .unions import UnionEditor
+
 from .pane import Pydantic
 
 # Needed for VS Code/ pyright to discover the available items
 __all__ = [
     "infer_widget",
+    "ChangeEvent",
+    "ChangeStream",
+    "DictState",
+    "FormState",
+    "Hint",
     "ItemDictEditor",
     "ItemListEditor",
+    "LargeTextEditor",
+    "ListState",
     "Pydantic",
     "PydanticModelEditor",
     "PydanticModelEditorCard",
+    "ReadOnlyView",
+    "ScalarDictEditor",
+    "ScalarListEditor",
+    "ScalarTupleEditor",
+    "SharedModel",
+    "TrafficRecord",
+    "UnionEditor",
 ]
 
 try:
@@ -84,6 +116,20 @@ try:
 except ImportError:
     pass
 
+try:
+    from .tables import ItemTableEditor
+    __all__.append('ItemTableEditor')
+
+except ImportError:
+    pass
+
+try:
+    from .files import FileUploadEditor
+    __all__.append('FileUploadEditor')
+
+except ImportError:
+    pass
+
 try:
     from .numpy import NPArray
     __all__.append('NPArray')
@@ -0,0 +1,164 @@
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from typing import Optional, Type
+
+from pydantic import BaseModel
+
+
+logger = logging.getLogger(__name__)
+
+class ModelStore:
+    """Base class for the local stores autosaved models are persisted to."""
+
+    def load(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def save(self, key: str, data: str):
+        raise NotImplementedError
+
+
+class JSONFileStore(ModelStore):
+    """Stores the JSON of a single model in a file.
+    Writes go to a temporary file which then replaces the target
+    so a crash never leaves a partially written file behind.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.fspath(path)
+
+    def load(self, key: str) -> Optional[str]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def save(self, key: str, data: str):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class SQLiteStore(ModelStore):
+    """Stores the JSON of any number of models in a SQLite database,
+    one row per key.
+    """
+
+    table = "pydantic_panel_autosave"
+
+    def __init__(self, path: str):
+        self.path = os.fspath(path)
+        with self._connect() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+
+    def _connect(self):
+        # A connection per operation, writes happen on the autosave thread
+        return sqlite3.connect(self.path)
+
+    def load(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT data FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, key: str, data: str):
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, data) VALUES (?, ?)",
+                (key, data),
+            )
+
+
+def store_for(target) -> ModelStore:
+    """Returns a store for a path, SQLite for .db/.sqlite/.sqlite3 files
+    and a JSON file otherwise. Stores are passed through as is.
+    """
+    if isinstance(target, ModelStore):
+        return target
+    path = os.fspath(target)
+    if os.path.splitext(path)[1].lower() in (".db", ".sqlite", ".sqlite3"):
+        return SQLiteStore(path)
+    return JSONFileStore(path)
+
+
+def model_key(class_: Type[BaseModel]) -> str:
+    return f"{class_.__module__}.{class_.__qualname__}"
+
+
+class AutoSaver:
+    """Persists a model to a store on a background thread.
+
+    Calls to `schedule` are coalesced so that at most one write happens
+    per `interval` seconds, writing whatever model was scheduled last.
+    """
+
+    def __init__(self, store: ModelStore, key: str, interval: float = 1.0):
+        self.store = store
+        self.key = key
+        self.interval = interval
+        self.writes = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending = None
+        self._timer = None
+        self._last_write = float("-inf")
+
+    def restore(self, class_: Type[BaseModel]) -> Optional[BaseModel]:
+        """Returns the saved model, None if nothing was saved or the
+        saved data is corrupt or does not match the current model.
+        """
+        try:
+            data = self.store.load(self.key)
+            if data is None:
+                return None
+            return class_.model_validate_json(data)
+        except ValueError as e:
+            # ValidationError and UnicodeDecodeError are ValueErrors
+            logger.warning(
+                "Ignoring the autosaved %s %r, it could not be restored: %s",
+                class_.__name__,
+                self.key,
+                e,
+            )
+            return None
+
+    def schedule(self, model: BaseModel):
+        with self._lock:
+            self._pending = model
+            if self._timer is not None:
+                return
+            delay = max(0.0, self._last_write + self.interval - time.monotonic())
+            self._timer = threading.Timer(delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Writes the pending model, if any, right away."""
+        with self._lock:
+            model, self._pending = self._pending, None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if model is None:
+                return
+            self._last_write = time.monotonic()
+
+        # Writing outside of the lock keeps `schedule` from blocking on disk
+        with self._write_lock:
+            self.store.save(self.key, model.model_dump_json())
+            self.writes += 1
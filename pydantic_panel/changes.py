@@ -0,0 +1,123 @@
+import asyncio
+import itertools
+import threading
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+OVERFLOW_POLICIES = ("coalesce", "drop_oldest")
+
+
+class ChangeEvent:
+    """A validated change of a model edited in an editor.
+
+    `path` is the tuple of field names leading to the changed field
+    and is empty when the whole model was replaced. The full model is
+    only copied when `model()` is called.
+    """
+
+    __slots__ = ("path", "old", "new", "_get_model")
+
+    def __init__(self, path: Tuple[str, ...], old: Any, new: Any,
+                 get_model: Callable[[], Optional[BaseModel]]):
+        self.path = path
+        self.old = old
+        self.new = new
+        self._get_model = get_model
+
+    def __repr__(self):
+        return f"ChangeEvent(path={self.path!r}, old={self.old!r}, new={self.new!r})"
+
+    def model(self) -> Optional[BaseModel]:
+        """Returns a copy of the edited model as it is now."""
+        model = self._get_model()
+        return None if model is None else model.model_copy(deep=True)
+
+
+class ChangeStream:
+    """A bounded buffer of ChangeEvents consumed with `async for`.
+
+    Events are pushed from the UI thread without blocking. When the
+    buffer holds `maxsize` events the oldest one is dropped. With the
+    `coalesce` policy a change of a field that still has a pending
+    event updates that event instead, keeping its original `old`.
+    """
+
+    def __init__(self, maxsize: int = 1000, overflow: str = "coalesce"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}.")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        self._events = OrderedDict()
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._waiter = None
+        self._loop = None
+
+    def __len__(self):
+        return len(self._events)
+
+    def push(self, event: ChangeEvent):
+        with self._lock:
+            if self.closed:
+                return
+            if self.overflow == "coalesce":
+                key = event.path
+                pending = self._events.get(key, None)
+                if pending is not None:
+                    pending.new = event.new
+                    self.coalesced += 1
+                    return
+            else:
+                key = next(self._counter)
+
+            if len(self._events) >= self.maxsize:
+                self._events.popitem(last=False)
+                self.dropped += 1
+            self._events[key] = event
+        self._wake()
+
+    def close(self):
+        """Ends the iteration once the pending events are consumed."""
+        with self._lock:
+            self.closed = True
+        self._wake()
+
+    def _wake(self):
+        with self._lock:
+            waiter, loop, self._waiter = self._waiter, self._loop, None
+        if waiter is not None:
+            loop.call_soon_threadsafe(_resolve, waiter)
+
+    def get_nowait(self) -> Optional[ChangeEvent]:
+        with self._lock:
+            if not self._events:
+                return None
+            return self._events.popitem(last=False)[1]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> ChangeEvent:
+        while True:
+            with self._lock:
+                if self._events:
+                    return self._events.popitem(last=False)[1]
+                if self.closed:
+                    raise StopAsyncIteration
+                self._loop = asyncio.get_running_loop()
+                self._waiter = waiter = self._loop.create_future()
+            await waiter
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
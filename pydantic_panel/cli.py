@@ -0,0 +1,132 @@
+"""Command line interface of pydantic-panel.
+
+Serve editors for pydantic models without writing an app script::
+
+    pydantic-panel serve my_package.config:Settings --num-procs 4
+"""
+
+import argparse
+import importlib
+import logging
+import sys
+import time
+
+from typing import Callable, Dict, List, Optional, Sequence, Type
+
+import panel as pn
+
+from pydantic import BaseModel
+
+from .pane import Pydantic
+from .widgets import PydanticModelEditor
+
+
+logger = logging.getLogger("pydantic_panel.serve")
+
+
+def load_target(target: str) -> Type[BaseModel]:
+    """Imports a model from a `module:Model` target."""
+    module_name, _, attr = target.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Target {target!r} is not of the form module:Model.")
+    obj = importlib.import_module(module_name)
+    for name in attr.split("."):
+        obj = getattr(obj, name)
+    if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+        raise TypeError(f"Target {target!r} is not a pydantic model.")
+    return obj
+
+
+def prewarm(models: Sequence[Type[BaseModel]]) -> Dict[str, float]:
+    """Builds and discards an editor for each model so the widget
+    dispatch and validator caches are filled before the server
+    accepts connections (and before worker processes are forked).
+
+    Returns:
+        dict: Seconds spent building the first editor of each model.
+    """
+    times = {}
+    for model in models:
+        start = time.perf_counter()
+        PydanticModelEditor(class_=model).teardown()
+        times[model.__name__] = time.perf_counter() - start
+    return times
+
+
+def make_app(model: Type[BaseModel], **params) -> Callable[[], Pydantic]:
+    """Returns a function building the app of a session, logging how
+    long it took.
+    """
+
+    def app():
+        start = time.perf_counter()
+        pane = Pydantic(model, **params)
+        logger.info(
+            "Created %s session in %.1f ms",
+            model.__name__,
+            (time.perf_counter() - start) * 1000,
+        )
+        return pane
+
+    app.__name__ = model.__name__
+    return app
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pydantic-panel")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Serve editors for pydantic models.")
+    serve.add_argument("targets", nargs="+", help="Models to serve, as module:Model.")
+    serve.add_argument("--port", type=int, default=5006)
+    serve.add_argument("--address", default=None)
+    serve.add_argument(
+        "--num-procs",
+        type=int,
+        default=1,
+        help="Number of worker processes, 0 uses one per core.",
+    )
+    serve.add_argument(
+        "--allow-websocket-origin", action="append", default=None, dest="origins"
+    )
+    serve.add_argument("--no-prewarm", action="store_false", dest="prewarm")
+    serve.add_argument("--show", action="store_true")
+    serve.add_argument("--progressive", action="store_true")
+    return parser
+
+
+def serve(args: argparse.Namespace, start: bool = True):
+    started = time.perf_counter()
+    models = [load_target(target) for target in args.targets]
+
+    if args.prewarm:
+        for name, seconds in prewarm(models).items():
+            logger.info("Prewarmed %s in %.1f ms", name, seconds * 1000)
+
+    params = dict(progressive=True) if args.progressive else {}
+    apps = {model.__name__: make_app(model, **params) for model in models}
+    logger.info(
+        "Serving %s, started in %.2f s",
+        ", ".join(apps),
+        time.perf_counter() - started,
+    )
+    return pn.serve(
+        apps,
+        port=args.port,
+        address=args.address,
+        num_procs=args.num_procs,
+        websocket_origin=args.origins,
+        show=args.show,
+        start=start,
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    args = make_parser().parse_args(argv)
+    if args.command == "serve":
+        serve(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import math
 import param
 import datetime
 import annotated_types
@@ -14,6 +15,10 @@ from plum import dispatch
 from numbers import Integral, Number
 from panel import Param, Column
 
+from .hints import field_hint
+from .scalars import infer_scalar_collection_widget
+from .text import LargeTextEditor, LARGE_TEXT_THRESHOLD
+
 
 from panel.widgets import (
     Widget,
@@ -41,6 +46,48 @@ def clean_kwargs(obj: param.Parameterized,
     return {k: v for k, v in kwargs.items() if k in obj.param.values()}
 
 
+def field_bounds(field: FieldInfo, integral: bool = False) -> tuple[Any, Any, Any]:
+    """Returns the start, end and step of a field's Gt/Ge/Lt/Le and
+    MultipleOf constraints, for widgets to enforce them in the browser.
+
+    Bounds are rounded inwards to the nearest valid multiple of the
+    step (1 for integers). Exclusive bounds of other values without a
+    step can not be expressed exactly, values equal to the bound pass
+    the widget and are rejected by the model validator.
+    """
+    start = None
+    end = None
+    step = None
+    exclusive = set()
+    for m in field.metadata:
+        if isinstance(m, annotated_types.Gt):
+            start = m.gt
+            exclusive.add("start")
+        if isinstance(m, annotated_types.Ge):
+            start = m.ge
+            exclusive.discard("start")
+        if isinstance(m, annotated_types.Lt):
+            end = m.lt
+            exclusive.add("end")
+        if isinstance(m, annotated_types.Le):
+            end = m.le
+            exclusive.discard("end")
+        if isinstance(m, annotated_types.MultipleOf):
+            step = m.multiple_of
+
+    unit = 1 if step is None and integral else step
+    if unit:
+        if start is not None:
+            bound, start = start, math.ceil(start / unit) * unit
+            if "start" in exclusive and start == bound:
+                start += unit
+        if end is not None:
+            bound, end = end, math.floor(end / unit) * unit
+            if "end" in exclusive and end == bound:
+                end -= unit
+    return start, end, step
+
+
 @dispatch
 def infer_widget(value: Any, field: Optional[FieldInfo] = None, **kwargs) -> Widget:
     """Fallback function when a more specific
@@ -73,15 +120,9 @@ def infer_widget(value: Integral, field: Optional[FieldInfo] = None, **kwargs) -
             kwargs = clean_kwargs(Select, kwargs)
             return Select(value=value, options=options, **kwargs)
 
-        for m in field.metadata:
-            if isinstance(m, annotated_types.Gt):
-                start = m.gt + 1
-            if isinstance(m, annotated_types.Ge):
-                start = m.ge
-            if isinstance(m, annotated_types.Lt):
-                end = m.lt - 1
-            if isinstance(m, annotated_types.Le):
-                end = m.le
+        start, end, step = field_bounds(field, integral=True)
+        if step is not None:
+            kwargs["step"] = step
 
     kwargs = clean_kwargs(IntInput, kwargs)
     return IntInput(value=value, start=start, end=end, **kwargs)
@@ -91,6 +132,7 @@ def infer_widget(value: Integral, field: Optional[FieldInfo] = None, **kwargs) -
 def infer_widget(value: Number, field: Optional[FieldInfo] = None, **kwargs) -> Widget:
     start = None
     end = None
+    step = None
     if field is not None:
         if type(field.annotation) == _LiteralGenericAlias:
             options = list(field.annotation.__args__)
@@ -100,17 +142,12 @@ def infer_widget(value: Number, field: Optional[FieldInfo] = None, **kwargs) ->
             kwargs = clean_kwargs(Select, kwargs)
             return Select(value=value, options=options, **kwargs)
 
-        for m in field.metadata:
-            if isinstance(m, annotated_types.Gt):
-                start = m.gt + 1
-            if isinstance(m, annotated_types.Ge):
-                start = m.ge
-            if isinstance(m, annotated_types.Lt):
-                end = m.lt - 1
-            if isinstance(m, annotated_types.Le):
-                end = m.le
+        start, end, step = field_bounds(field)
 
     kwargs = clean_kwargs(NumberInput, kwargs)
+    # NumberInput creates a FloatInput which accepts a step
+    if step is not None:
+        kwargs["step"] = step
     return NumberInput(value=value, start=start, end=end, **kwargs)
 
 
@@ -126,6 +163,7 @@ def infer_widget(value: bool, field: Optional[FieldInfo] = None, **kwargs) -> Wi
 def infer_widget(value: str, field: Optional[FieldInfo] = None, **kwargs) -> Widget:
     min_length = kwargs.pop("min_length", None)
     max_length = kwargs.pop("max_length", 100)
+    large_text = kwargs.pop("large_text", None)
 
     if field is not None:
         if type(field.annotation) == _LiteralGenericAlias:
@@ -141,6 +179,20 @@ def infer_widget(value: str, field: Optional[FieldInfo] = None, **kwargs) -> Wid
             if isinstance(m, annotated_types.MaxLen):
                 max_length = m.max_length
 
+        if large_text is None:
+            large_text = field_hint(field, "large_text", None)
+
+    if large_text is None:
+        large_text = isinstance(value, str) and len(value) >= LARGE_TEXT_THRESHOLD
+
+    if large_text:
+        kwargs = clean_kwargs(LargeTextEditor, kwargs)
+        if field is not None and any(
+            isinstance(m, annotated_types.MaxLen) for m in field.metadata
+        ):
+            kwargs["max_length"] = max_length
+        return LargeTextEditor(value=value, **kwargs)
+
     kwargs["min_length"] = min_length
 
     if max_length is not None and max_length < 100:
@@ -158,8 +210,16 @@ def infer_widget(value: list, field: Optional[FieldInfo] = None, **kwargs) -> Wi
         if value not in options:
             value = []
         kwargs = clean_kwargs(ListInput, kwargs)
+        max_items = None
+        for m in field.metadata:
+            if isinstance(m, annotated_types.MaxLen):
+                max_items = m.max_length
         return MultiChoice(name=field.alias, 
-                           value=value, options=options)
+                           value=value, options=options, max_items=max_items)
+
+    widget = infer_scalar_collection_widget(value, field, **kwargs)
+    if widget is not None:
+        return widget
 
     kwargs = clean_kwargs(ListInput, kwargs)
     return ListInput(value=value, **kwargs)
@@ -167,12 +227,20 @@ def infer_widget(value: list, field: Optional[FieldInfo] = None, **kwargs) -> Wi
 
 @dispatch
 def infer_widget(value: dict, field: Optional[FieldInfo] = None, **kwargs) -> Widget:
+    widget = infer_scalar_collection_widget(value, field, **kwargs)
+    if widget is not None:
+        return widget
+
     kwargs = clean_kwargs(DictInput, kwargs)
     return DictInput(value=value, **kwargs)
 
 
 @dispatch
 def infer_widget(value: tuple, field: Optional[FieldInfo] = None, **kwargs) -> Widget:
+    widget = infer_scalar_collection_widget(value, field, **kwargs)
+    if widget is not None:
+        return widget
+
     kwargs = clean_kwargs(TupleInput, kwargs)
     return TupleInput(value=value, **kwargs)
 
@@ -181,6 +249,10 @@ def infer_widget(value: tuple, field: Optional[FieldInfo] = None, **kwargs) -> W
 def infer_widget(
     value: datetime.datetime, field: Optional[FieldInfo] = None, **kwargs
 ):
+    if field is not None:
+        start, end, _ = field_bounds(field)
+        kwargs.setdefault("start", start)
+        kwargs.setdefault("end", end)
     kwargs = clean_kwargs(DatetimePicker, kwargs)
     return DatetimePicker(value=value, **kwargs)
 
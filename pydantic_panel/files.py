@@ -0,0 +1,146 @@
+import os
+import pathlib
+import tempfile
+
+import param
+
+from typing import ClassVar, Optional, Type
+
+from plum import dispatch
+from pydantic.fields import FieldInfo
+
+from panel.layout import Column, ListPanel
+from panel.pane import Markdown
+from panel.widgets import CompositeWidget, FileDropper, Widget
+
+from .dispatchers import clean_kwargs
+from .text import format_size
+
+
+class DiskFileDropper(FileDropper):
+    """A FileDropper that appends every uploaded chunk to a file on disk
+    instead of buffering the whole upload in memory.
+
+    `value` maps the uploaded file names to the paths they were
+    written to. Files removed in the browser are deleted from disk,
+    the others are not removed when the widget goes away, they belong
+    to whatever model the paths end up in.
+    """
+
+    directory = param.String(
+        default=None,
+        allow_None=True,
+        doc="""Directory uploads are written to, a new temporary
+        directory is created on the first upload if not set.""",
+    )
+
+    def _upload_path(self, name: str) -> pathlib.Path:
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="pydantic-panel-")
+        # Only keep the base name, the browser controls the rest
+        return pathlib.Path(self.directory) / os.path.basename(name)
+
+    def _process_event(self, event):
+        data = event.data
+        name = data["name"]
+        if event.event_name == "delete_event":
+            self.mime_type.pop(name, None)
+            path = self.value.pop(name, None)
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+            self.param.trigger("mime_type", "value")
+            return
+
+        path = self._upload_path(name)
+        with open(path, "wb" if data["chunk"] == 1 else "ab") as f:
+            f.write(data["data"])
+        if data["chunk"] != data["total_chunks"]:
+            return
+
+        self.value[name] = path
+        self.mime_type[name] = data["type"]
+        self.param.trigger("mime_type", "value")
+
+
+class FileUploadEditor(CompositeWidget):
+    """Edits a `bytes` or `Path` field with a file upload.
+
+    Uploads are streamed to disk chunk by chunk, for `Path` fields
+    the value is the path of the uploaded file so its content never
+    has to be held in memory. For `bytes` fields the file is read
+    once after the upload is complete. Removing the uploaded file
+    resets the value to `default`.
+    """
+
+    _composite_type: ClassVar[Type[ListPanel]] = Column
+
+    value = param.Parameter(default=None)
+
+    default = param.Parameter(
+        default=None, doc="The value when no file is uploaded, e.g. the field default."
+    )
+
+    as_bytes = param.Boolean(default=False)
+
+    directory = param.String(default=None, allow_None=True)
+
+    accepted_filetypes = param.List(default=[])
+
+    max_file_size = param.String(default=None, allow_None=True)
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._summary = Markdown(sizing_mode="stretch_width")
+        self._dropper = DiskFileDropper(
+            directory=self.directory,
+            accepted_filetypes=self.accepted_filetypes,
+            max_file_size=self.max_file_size,
+            multiple=False,
+            sizing_mode="stretch_width",
+        )
+        self._dropper.param.watch(self._uploaded, "value")
+        self.param.watch(self._update_summary, ["value", "name"])
+        self._update_summary()
+        self._composite[:] = [self._summary, self._dropper]
+
+    def _uploaded(self, event):
+        if not event.new:
+            # The file was removed and deleted from disk
+            self.value = self.default
+            return
+        path = list(event.new.values())[-1]
+        self.value = path.read_bytes() if self.as_bytes else path
+
+    def _update_summary(self, *events):
+        if self.value is None:
+            description = "No file"
+        elif isinstance(self.value, (bytes, bytearray)):
+            description = format_size(len(self.value))
+        elif os.path.exists(self.value):
+            size = format_size(os.path.getsize(self.value))
+            description = f"`{os.path.basename(self.value)}` ({size})"
+        else:
+            description = f"`{self.value}`"
+        self._summary.object = f"**{self.name}**: {description}"
+
+
+def _field_default(field: Optional[FieldInfo]):
+    if field is None or field.is_required():
+        return None
+    return field.get_default(call_default_factory=True)
+
+
+@dispatch
+def infer_widget(value: bytes, field: Optional[FieldInfo] = None, **kwargs) -> Widget:
+    kwargs = clean_kwargs(FileUploadEditor, kwargs)
+    kwargs.setdefault("default", _field_default(field))
+    return FileUploadEditor(value=value, as_bytes=True, **kwargs)
+
+
+@dispatch
+def infer_widget(
+    value: pathlib.PurePath, field: Optional[FieldInfo] = None, **kwargs
+) -> Widget:
+    kwargs = clean_kwargs(FileUploadEditor, kwargs)
+    kwargs.setdefault("default", _field_default(field))
+    return FileUploadEditor(value=value, **kwargs)
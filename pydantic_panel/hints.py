@@ -0,0 +1,40 @@
+from typing import Any, Optional
+
+from pydantic.fields import FieldInfo
+
+
+class Hint:
+    """Annotated metadata passing options to the editor of a field.
+    Unlike `json_schema_extra` the options do not end up in the
+    model's JSON schema.
+
+    >>> class Report(BaseModel):
+    ...     body: Annotated[str, Hint(large_text=True)] = ""
+    """
+
+    __slots__ = ("options",)
+
+    def __init__(self, **options):
+        self.options = options
+
+    def __repr__(self):
+        options = ", ".join(f"{k}={v!r}" for k, v in self.options.items())
+        return f"Hint({options})"
+
+    def __eq__(self, other):
+        return isinstance(other, Hint) and other.options == self.options
+
+    def __hash__(self):
+        return hash(tuple(sorted(self.options.items())))
+
+
+def field_hint(field: Optional[FieldInfo], option: str, default: Any = None) -> Any:
+    """Returns an option given to a field with a Hint, the last
+    Hint setting it wins.
+    """
+    if field is None:
+        return default
+    for hint in reversed(field.metadata):
+        if isinstance(hint, Hint) and option in hint.options:
+            return hint.options[option]
+    return default
@@ -6,17 +6,27 @@ from bokeh.document import Document
 from bokeh.model import Model
 from panel.io import init_doc, state
 from panel.layout import Panel, WidgetBox
-from panel.pane import PaneBase
 from pyviz_comms import Comm
 
+from contextlib import contextmanager
+
+try:
+    # PaneBase is no longer a Viewable since panel 1.0
+    from panel.pane.base import Pane as PaneBase
+except ImportError:
+    from panel.pane import PaneBase
+
 
 from typing import (
     Any,
     ClassVar,
+    Dict,
     Optional,
 )
 
 from .dispatchers import infer_widget
+from .readonly import readonly_view
+from .traffic import recording
 
 pyobject = object
 
@@ -46,12 +56,28 @@ class Pydantic(PaneBase):
 
     priority: ClassVar = None
 
+    # The widget tree syncs itself, changes of object never rerender
+    _rerender_params: ClassVar[list] = []
+
+    _rename: ClassVar[dict] = {
+        "default_layout": None,
+        "loading": None,
+        "object": None,
+        "readonly": None,
+    }
+
     default_layout: Panel = param.ClassSelector(
         default=WidgetBox, class_=Panel, is_instance=False
     )
 
     object = param.Parameter(default=None)
 
+    readonly = param.Boolean(
+        default=False,
+        doc="""Display the model as a single read-only HTML table instead
+        of building an editor, nested models become collapsible sections.""",
+    )
+
     def __init__(self, object=None, default_layout: Panel | None = None, **params):
         if default_layout:
             params["default_layout"] = default_layout
@@ -60,9 +86,19 @@ class Pydantic(PaneBase):
             name: params[name] for name in Pydantic.param.values() if name in params
         }
 
+        # The layout model shared by all views in a document, see _get_model
+        self._shared_views: Dict[int, Dict[str, Any]] = {}
+        self.traffic = []
+
         super().__init__(object, **pane_params)
 
-        if isinstance(object, type):
+        if self.readonly:
+            if isinstance(object, type):
+                raise ValueError("readonly requires a model instance, not a class.")
+            self.widget = readonly_view(object, **params)
+            self.param.watch(self._refresh_readonly, "object")
+
+        elif isinstance(object, type):
 
             if issubclass(object, pydantic.BaseModel):
                 params["class_"] = object
@@ -79,6 +115,28 @@ class Pydantic(PaneBase):
 
         self.layout = self.default_layout(self.widget)
 
+    @property
+    def _view(self):
+        # Read-only models render as the HTML pane alone, without a layout
+        return self.widget if self.readonly else self.layout
+
+    def _refresh_readonly(self, *events):
+        self.widget.object = self.object
+
+    def refresh(self):
+        """Re-renders a read-only view, e.g. after the model was mutated."""
+        if self.readonly:
+            self.widget.refresh()
+
+    @contextmanager
+    def record_traffic(self, operation: Optional[str] = None):
+        """Records the Bokeh document traffic of the operations run
+        inside the context, the TrafficRecord is appended to `traffic`.
+        """
+        with recording(self, operation) as record:
+            yield record
+        self.traffic.append(record)
+
     def _get_model(
         self,
         doc: Document,
@@ -86,14 +144,49 @@ class Pydantic(PaneBase):
         parent: Optional[Model] = None,
         comm: Optional[Comm] = None,
     ) -> Model:
-        model = self.layout._get_model(doc, root, parent, comm)
-        self._models[root.ref["id"]] = (model, parent)
+        # Views of the pane in the same document (e.g. a sidebar and a
+        # modal) reuse the model tree built for the first view. Bokeh
+        # models can not be shared across documents.
+        ref = root.ref["id"]
+        shared = self._shared_views.get(id(doc))
+        if shared is None:
+            model = self._view._get_model(doc, root, parent, comm)
+            self._shared_views[id(doc)] = dict(model=model, owner=root, refs={ref})
+        else:
+            model = shared["model"]
+            shared["refs"].add(ref)
+        self._models[ref] = (model, parent)
         return model
 
     def _cleanup(self, root: Optional[Model] = None) -> None:
-        self.layout._cleanup(root)
+        self._release_view(root)
         super()._cleanup(root)
 
+        # Once the last view is destroyed (e.g. the session closed)
+        # release the watchers and callbacks holding on to the widget
+        if root is not None and not self._models and hasattr(self.widget, "teardown"):
+            self.widget.teardown()
+
+    def _release_view(self, root: Optional[Model] = None) -> None:
+        """Cleans up the layout once no view in the document of `root`
+        uses the shared model tree anymore.
+        """
+        if root is None:
+            self._view._cleanup(root)
+            return
+
+        ref = root.ref["id"]
+        for doc_id, shared in list(self._shared_views.items()):
+            if ref not in shared["refs"]:
+                continue
+            shared["refs"].discard(ref)
+            if not shared["refs"]:
+                del self._shared_views[doc_id]
+                self._view._cleanup(shared["owner"])
+            return
+
+        self._view._cleanup(root)
+
     @classmethod
     def applies(cls, obj: Any, **params) -> Optional[bool]:
         if isinstance(obj, param.Parameterized):
@@ -167,7 +260,7 @@ class Pydantic(PaneBase):
         Returns the bokeh model corresponding to this panel object
         """
         doc = init_doc(doc)
-        root = self.layout.get_root(doc, comm, preprocess)
+        root = self._view.get_root(doc, comm, preprocess)
         ref = root.ref["id"]
         self._models[ref] = (root, None)
         state._views[ref] = (self, root, doc, comm)
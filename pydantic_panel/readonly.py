@@ -0,0 +1,103 @@
+from html import escape
+from typing import Any
+
+from pydantic import BaseModel
+
+from panel.pane import HTML
+
+
+READONLY_CSS = """
+table.pydantic-panel-readonly {
+  border-collapse: collapse;
+}
+table.pydantic-panel-readonly th {
+  text-align: left;
+  vertical-align: top;
+  padding: 2px 12px 2px 0;
+}
+table.pydantic-panel-readonly td {
+  padding: 2px 0;
+}
+table.pydantic-panel-readonly details {
+  margin-left: 4px;
+}
+"""
+
+
+def field_label(name: str) -> str:
+    return name.replace("_", " ").capitalize()
+
+
+def value_html(value: Any) -> str:
+    """Renders a field value, nested models become collapsible sections."""
+    if isinstance(value, BaseModel):
+        return (
+            f"<details><summary>{escape(type(value).__name__)}</summary>"
+            f"{model_html(value)}</details>"
+        )
+
+    if isinstance(value, dict) and any(isinstance(v, BaseModel) for v in value.values()):
+        items = value.items()
+    elif isinstance(value, (list, tuple)) and any(isinstance(v, BaseModel) for v in value):
+        items = enumerate(value)
+    else:
+        return escape(str(value))
+
+    return "".join(
+        f"<details><summary>{escape(str(key))}</summary>{value_html(item)}</details>"
+        for key, item in items
+    )
+
+
+def model_html(model: BaseModel) -> str:
+    """Renders a pydantic model as an HTML table with a row per field."""
+    rows = "".join(
+        f"<tr><th>{escape(field_label(name))}</th>"
+        f"<td>{value_html(getattr(model, name))}</td></tr>"
+        for name in type(model).model_fields
+    )
+    return f'<table class="pydantic-panel-readonly">{rows}</table>'
+
+
+def readonly_html(obj: Any) -> str:
+    if isinstance(obj, BaseModel):
+        return model_html(obj)
+    return value_html(obj)
+
+
+class ReadOnlyView(HTML):
+    """An HTML pane whose object is a model, or a list or dict of
+    models, rendered read-only. The view re-renders in place when
+    its object is replaced or `refresh` is called.
+    """
+
+    # Lower than the Pydantic pane, pn.panel never picks this view
+    priority = 0
+
+    @classmethod
+    def applies(cls, object: Any) -> bool:
+        if isinstance(object, dict):
+            object = list(object.values())
+        if isinstance(object, (list, tuple)):
+            return all(isinstance(o, BaseModel) for o in object)
+        return isinstance(object, BaseModel)
+
+    @property
+    def html(self) -> str:
+        return readonly_html(self.object)
+
+    def _transform_object(self, obj: Any) -> dict:
+        return dict(object=escape(readonly_html(obj)))
+
+    def refresh(self):
+        """Re-renders the view, e.g. after the model was mutated."""
+        self.param.trigger("object")
+
+
+def readonly_view(obj: Any, **params) -> ReadOnlyView:
+    """Returns a single HTML pane displaying a model, or a list or dict
+    of models, read-only.
+    """
+    params = {k: v for k, v in params.items() if k in HTML.param}
+    params["stylesheets"] = params.get("stylesheets", []) + [READONLY_CSS]
+    return ReadOnlyView(obj, **params)
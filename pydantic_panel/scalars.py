@@ -0,0 +1,381 @@
+import itertools
+
+import param
+import pandas as pd
+
+from typing import Annotated, Any, ClassVar, List, Optional, Type, get_args, get_origin
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+from panel.layout import Column, ListPanel, Row
+from panel.widgets import Button, CompositeWidget, Tabulator, Widget
+
+from .state import DictState, ListState
+
+
+SCALAR_ELEMENT_TYPES = (bool, int, float, str)
+
+
+def _base_type(annotation: Any) -> Any:
+    if get_origin(annotation) is Annotated:
+        return get_args(annotation)[0]
+    return annotation
+
+
+def is_scalar(annotation: Any) -> bool:
+    return _base_type(annotation) in SCALAR_ELEMENT_TYPES
+
+
+def _default(annotation: Any) -> Any:
+    return _base_type(annotation)()
+
+
+def _unique_key(key_type: Any, taken: Any) -> Any:
+    """Returns the default of a key type or, if taken, the first of
+    1, 2, ... converted to it that is not, e.g. "1" for str keys.
+    """
+    type_ = _base_type(key_type)
+    key = type_()
+    counter = itertools.count(1)
+    while key in taken:
+        n = next(counter)
+        if type_ is bool and n > 1:
+            raise ValueError("All bool keys are taken.")
+        key = type_(n)
+    return key
+
+
+class ScalarCollectionEditor(CompositeWidget):
+    """Base class of the editors of collections of scalars.
+
+    Elements are shown in a paginated table and edited in place.
+    Only the edited element is validated, rejected edits are reverted
+    and recorded in `errors` by key. While the value is triggered for
+    an accepted edit `validated_edit` holds its key and element, so
+    model editors can assign it without validating the whole field.
+    """
+
+    _composite_type: ClassVar[Type[ListPanel]] = Column
+
+    value = param.Parameter(default=None)
+
+    errors = param.Dict(
+        default={},
+        constant=True,
+        doc="Validation errors of the last rejected edit of each element, by key.",
+    )
+
+    item_edited = param.Event()
+
+    page_size = param.Integer(default=50, bounds=(1, None))
+
+    allow_add = param.Boolean(True)
+
+    allow_remove = param.Boolean(True)
+
+    _columns: ClassVar[List[str]] = ["value"]
+
+    __abstract = True
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._updating = False
+        self.validated_edit = None
+        self._table = Tabulator(
+            value=self._frame(),
+            pagination="remote",
+            page_size=self.page_size,
+            selectable="checkbox" if self._can_remove() else False,
+            sizing_mode="stretch_width",
+        )
+        self._table.on_edit(self._validate_cell)
+        self.param.watch(self._value_changed, "value")
+        self._composite[:] = [self._table, *self._controls()]
+
+    def _can_add(self) -> bool:
+        return self.allow_add
+
+    def _can_remove(self) -> bool:
+        return self.allow_remove
+
+    def _controls(self) -> list:
+        buttons = []
+        if self._can_add():
+            add_button = Button(name="➕", width=50, width_policy="auto")
+            add_button.on_click(lambda event: self.add_item())
+            buttons.append(add_button)
+        if self._can_remove():
+            remove_button = Button(name="❌ Remove selected", width_policy="auto")
+            remove_button.on_click(lambda event: self.remove_selected())
+            buttons.append(remove_button)
+        return [Row(*buttons)] if buttons else []
+
+    def keys(self) -> list:
+        raise NotImplementedError
+
+    def adapter(self, key: Any) -> TypeAdapter:
+        raise NotImplementedError
+
+    def _frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"value": list(self.value or [])}, columns=self._columns)
+
+    def _set_item(self, key: Any, item: Any):
+        raise NotImplementedError
+
+    def _value_changed(self, *events):
+        if self._updating:
+            return
+        if self.errors:
+            with param.edit_constant(self):
+                self.errors = {}
+        self._table.value = self._frame()
+
+    def _set_error(self, key: Any, errors: Optional[list]):
+        if errors is None and key not in self.errors:
+            return
+        field_errors = dict(self.errors)
+        if errors is None:
+            del field_errors[key]
+        else:
+            field_errors[key] = errors
+        with param.edit_constant(self):
+            self.errors = field_errors
+
+    def _validate_cell(self, event):
+        key = self.keys()[event.row]
+        try:
+            item = self.adapter(key).validate_python(event.value)
+        except ValidationError as e:
+            self._table.patch({event.column: [(event.row, event.old)]})
+            self._set_error(key, e.errors(include_url=False))
+            return
+
+        self._set_error(key, None)
+        if item != event.value:
+            # Show the validated element, e.g. "3" coerced to 3
+            self._table.patch({event.column: [(event.row, item)]})
+        self._updating = True
+        self.validated_edit = (key, item)
+        try:
+            self._set_item(key, item)
+        finally:
+            self._updating = False
+            self.validated_edit = None
+        self.item_edited = True
+
+    def remove_selected(self):
+        keys = self.keys()
+        for row in sorted(self._table.selection, reverse=True):
+            self.remove_item(keys[row])
+        self._table.selection = []
+
+    def add_item(self, item: Any = None, name: Any = None):
+        raise NotImplementedError
+
+    def remove_item(self, name: Any):
+        raise NotImplementedError
+
+
+class ScalarListEditor(ScalarCollectionEditor):
+    """Edits a list of scalars element by element."""
+
+    item_type = param.Parameter(default=float)
+
+    value = param.List(default=[])
+
+    def __init__(self, **params):
+        self._adapter = None
+        super().__init__(**params)
+
+    def keys(self) -> list:
+        return list(range(len(self.value)))
+
+    def adapter(self, key: Any) -> TypeAdapter:
+        if self._adapter is None:
+            self._adapter = TypeAdapter(self.item_type)
+        return self._adapter
+
+    def _set_item(self, key: Any, item: Any):
+        ListState(self.value).set(key, item)
+        self.param.trigger("value")
+
+    def add_item(self, item: Any = None, name: Any = None):
+        if item is None:
+            item = _default(self.item_type)
+        ListState(self.value).add(item, name)
+        self.param.trigger("value")
+
+    def remove_item(self, name: Any):
+        ListState(self.value).remove(name)
+        self.param.trigger("value")
+
+
+class ScalarTupleEditor(ScalarCollectionEditor):
+    """Edits a tuple of scalars element by element. Fixed length
+    tuples have a type per position and can not be resized.
+    """
+
+    item_types = param.List(default=[])
+
+    variadic = param.Boolean(default=False)
+
+    value = param.Parameter(default=())
+
+    def __init__(self, **params):
+        self._adapters = {}
+        super().__init__(**params)
+
+    def _can_add(self) -> bool:
+        return self.variadic and self.allow_add
+
+    def _can_remove(self) -> bool:
+        return self.variadic and self.allow_remove
+
+    def keys(self) -> list:
+        return list(range(len(self.value)))
+
+    def _item_type(self, key: int) -> Any:
+        return self.item_types[0] if self.variadic else self.item_types[key]
+
+    def adapter(self, key: Any) -> TypeAdapter:
+        if self.variadic:
+            key = 0
+        if key not in self._adapters:
+            self._adapters[key] = TypeAdapter(self._item_type(key))
+        return self._adapters[key]
+
+    def _set_item(self, key: Any, item: Any):
+        items = list(self.value)
+        items[key] = item
+        self.value = tuple(items)
+
+    def add_item(self, item: Any = None, name: Any = None):
+        if item is None:
+            item = _default(self._item_type(len(self.value)))
+        items = list(self.value)
+        ListState(items).add(item, name)
+        self.value = tuple(items)
+
+    def remove_item(self, name: Any):
+        items = list(self.value)
+        ListState(items).remove(name)
+        self.value = tuple(items)
+
+
+class ScalarDictEditor(ScalarCollectionEditor):
+    """Edits a dict of scalars by key, keys are renamed by editing
+    the key column.
+    """
+
+    key_type = param.Parameter(default=str)
+
+    item_type = param.Parameter(default=float)
+
+    value = param.Dict(default={})
+
+    _columns: ClassVar[List[str]] = ["key", "value"]
+
+    def __init__(self, **params):
+        self._key_adapter = None
+        self._adapter = None
+        super().__init__(**params)
+
+    def keys(self) -> list:
+        return list(self.value)
+
+    def adapter(self, key: Any) -> TypeAdapter:
+        if self._adapter is None:
+            self._adapter = TypeAdapter(self.item_type)
+        return self._adapter
+
+    def _frame(self) -> pd.DataFrame:
+        value = self.value or {}
+        return pd.DataFrame(
+            {"key": list(value), "value": list(value.values())}, columns=self._columns
+        )
+
+    def _set_item(self, key: Any, item: Any):
+        DictState(self.value).set(key, item)
+        self.param.trigger("value")
+
+    def _validate_cell(self, event):
+        if event.column != "key":
+            return super()._validate_cell(event)
+
+        key = self.keys()[event.row]
+        if self._key_adapter is None:
+            self._key_adapter = TypeAdapter(self.key_type)
+        try:
+            new_key = self._key_adapter.validate_python(event.value)
+            if new_key in self.value and new_key != key:
+                raise ValueError(f"Duplicate key {new_key!r}.")
+        except (ValidationError, ValueError) as e:
+            self._table.patch({"key": [(event.row, event.old)]})
+            errors = (
+                e.errors(include_url=False)
+                if isinstance(e, ValidationError)
+                else [{"type": "value_error", "loc": ("key",), "msg": str(e)}]
+            )
+            self._set_error(key, errors)
+            return
+
+        self._set_error(key, None)
+        if new_key != key:
+            self.rename_item(key, new_key)
+        self.item_edited = True
+
+    def add_item(self, item: Any = None, name: Any = None):
+        if item is None:
+            item = _default(self.item_type)
+        if name is None:
+            name = _unique_key(self.key_type, self.value)
+        elif name in self.value:
+            raise ValueError(f"Duplicate key {name!r}.")
+        DictState(self.value).add(item, name)
+        self.param.trigger("value")
+
+    def remove_item(self, name: Any):
+        DictState(self.value).remove(name)
+        self.param.trigger("value")
+
+    def rename_item(self, name: Any, new_name: Any):
+        DictState(self.value).rename(name, new_name)
+        self.param.trigger("value")
+
+
+def infer_scalar_collection_widget(
+    value: Any, field: Optional[FieldInfo], **kwargs
+) -> Optional[Widget]:
+    """Returns an element-wise editor for list, dict and tuple fields
+    of scalars, None for any other field.
+    """
+    from .dispatchers import clean_kwargs
+
+    if field is None:
+        return None
+    annotation = _base_type(field.annotation)
+    origin, args = get_origin(annotation), get_args(annotation)
+
+    if origin is list and len(args) == 1 and is_scalar(args[0]):
+        kwargs = clean_kwargs(ScalarListEditor, kwargs)
+        return ScalarListEditor(value=list(value or []), item_type=args[0], **kwargs)
+
+    if origin is dict and len(args) == 2 and all(is_scalar(a) for a in args):
+        kwargs = clean_kwargs(ScalarDictEditor, kwargs)
+        return ScalarDictEditor(
+            value=dict(value or {}), key_type=args[0], item_type=args[1], **kwargs
+        )
+
+    if origin is tuple and args:
+        variadic = len(args) == 2 and args[1] is Ellipsis
+        item_types = list(args[:1] if variadic else args)
+        if all(is_scalar(a) for a in item_types):
+            kwargs = clean_kwargs(ScalarTupleEditor, kwargs)
+            return ScalarTupleEditor(
+                value=tuple(value or ()),
+                item_types=item_types,
+                variadic=variadic,
+                **kwargs,
+            )
+    return None
@@ -0,0 +1,160 @@
+import threading
+import weakref
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+import panel as pn
+
+from pydantic import BaseModel
+
+from .state import FormState
+
+
+CONFLICT_POLICIES = ("last_write_wins", "reject")
+
+
+class _Subscriber:
+    """An attached editor, its document and the field versions
+    it has displayed.
+    """
+
+    __slots__ = ("ref", "doc", "seen")
+
+    def __init__(self, editor, doc):
+        self.ref = weakref.ref(editor)
+        self.doc = doc
+        self.seen: Dict[str, int] = {}
+
+
+def _schedule(doc, callback: Callable):
+    """Runs a callback on the next tick of a served document,
+    right away otherwise.
+    """
+    if doc is None or doc.session_context is None:
+        callback()
+    else:
+        doc.add_next_tick_callback(callback)
+
+
+class SharedModel:
+    """A model instance edited by the editors of many sessions.
+
+    Each edit is validated once, on the shared instance, and the
+    accepted field value is then sent to every other attached editor
+    on the next tick of that editor's document.
+
+    An edit made to a field another session changed since the editing
+    session last displayed it is a conflict. With the `last_write_wins`
+    policy it is accepted, with `reject` it is rejected and the editor
+    is reset to the current value.
+    """
+
+    def __init__(self, value: BaseModel, conflict: str = "last_write_wins"):
+        if conflict not in CONFLICT_POLICIES:
+            raise ValueError(f"conflict must be one of {CONFLICT_POLICIES}.")
+        self.conflict = conflict
+        self.version = 0
+        self.validations = 0
+        self.conflicts = 0
+        self._state = FormState(type(value), value)
+        self._versions: Dict[str, int] = {}
+        self._subscribers: Dict[int, _Subscriber] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def value(self) -> BaseModel:
+        return self._state.value
+
+    @property
+    def class_(self) -> type:
+        return self._state.class_
+
+    def attach(self, editor, doc=None):
+        """Registers an editor to receive the changes of the model.
+        `doc` defaults to the document of the current session.
+        """
+        if doc is None:
+            doc = pn.state.curdoc
+        with self._lock:
+            subscriber = _Subscriber(editor, doc)
+            subscriber.seen = dict(self._versions)
+            self._subscribers[id(editor)] = subscriber
+
+    def detach(self, editor):
+        with self._lock:
+            self._subscribers.pop(id(editor), None)
+
+    @property
+    def editors(self) -> List[Any]:
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+        return [e for e in (s.ref() for s in subscribers) if e is not None]
+
+    def set_field(self, name: str, value: Any, source=None) -> Optional[list]:
+        """Validates and assigns a field edited in `source` and sends
+        it to the other attached editors.
+
+        Returns:
+            Optional[list]: The errors if the edit was rejected.
+        """
+        with self._lock:
+            subscriber = self._subscribers.get(id(source), None)
+            version = self._versions.get(name, 0)
+            if subscriber is not None and subscriber.seen.get(name, 0) < version:
+                self.conflicts += 1
+                if self.conflict == "reject":
+                    subscriber.seen[name] = version
+                    source._apply_shared(name, getattr(self.value, name))
+                    return [
+                        {
+                            "type": "conflict",
+                            "loc": (name,),
+                            "msg": "The field was changed in another session.",
+                            "input": value,
+                        }
+                    ]
+
+            self.validations += 1
+            if not self._state.set_field(name, value):
+                errors = self._state.errors[name]
+                self._state.set_error(name, None)
+                return errors
+
+            self.version += 1
+            version = self._versions[name] = self.version
+            if subscriber is not None:
+                subscriber.seen[name] = version
+            new = getattr(self.value, name)
+            targets = [s for key, s in self._subscribers.items() if key != id(source)]
+
+        for target in targets:
+            _schedule(target.doc, partial(self._deliver, target, name, new, version))
+        return None
+
+    def update(self, **fields) -> Dict[str, list]:
+        """Sets fields on the server side and sends them to all editors.
+
+        Returns:
+            dict: The errors of the rejected fields.
+        """
+        errors = {}
+        for name, value in fields.items():
+            field_errors = self.set_field(name, value)
+            if field_errors:
+                errors[name] = field_errors
+        return errors
+
+    def _deliver(self, subscriber: _Subscriber, name: str, value: Any, version: int):
+        editor = subscriber.ref()
+        with self._lock:
+            if editor is None:
+                self._subscribers = {
+                    k: s for k, s in self._subscribers.items() if s.ref() is not None
+                }
+                return
+            # A later change of the field was already delivered
+            if subscriber.seen.get(name, 0) >= version:
+                return
+            subscriber.seen[name] = version
+        editor._apply_shared(name, value)
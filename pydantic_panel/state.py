@@ -0,0 +1,437 @@
+import functools
+import math
+import operator
+
+from collections import OrderedDict
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from .hints import field_hint
+
+
+# Schema keys that do not affect which values are valid
+_NEUTRAL_KEYS = {"type", "ref", "metadata", "serialization", "strict"}
+
+_BOUNDS = {"gt": operator.gt, "ge": operator.ge, "lt": operator.lt, "le": operator.le}
+
+# Container schema keys that only describe the elements
+_ELEMENT_KEYS = {"items_schema", "keys_schema", "values_schema", "variadic_item_index"}
+
+_STR_CONFIG = ("str_strip_whitespace", "str_to_lower", "str_to_upper",
+               "str_min_length", "str_max_length")
+
+
+def _bounds_check(schema: dict) -> Callable[[Any], bool]:
+    bounds = [(_BOUNDS[k], schema[k]) for k in _BOUNDS if k in schema]
+    multiple_of = schema.get("multiple_of", None)
+
+    def check(value):
+        if multiple_of is not None and value % multiple_of:
+            return False
+        return all(op(value, bound) for op, bound in bounds)
+
+    return check
+
+
+def _field_check(schema: dict, config: dict) -> Optional[Callable[[Any], bool]]:
+    """Returns a check accepting a subset of the values the schema
+    accepts unchanged, None if the schema transforms values or runs
+    custom validators.
+    """
+    kind = schema["type"]
+    extra = set(schema) - _NEUTRAL_KEYS
+
+    if kind == "bool" and not extra:
+        return lambda value: type(value) is bool
+
+    if kind == "int" and extra <= {*_BOUNDS, "multiple_of"}:
+        in_bounds = _bounds_check(schema)
+        return lambda value: type(value) is int and in_bounds(value)
+
+    if kind == "float" and extra <= {*_BOUNDS, "allow_inf_nan"}:
+        in_bounds = _bounds_check(schema)
+        finite = not schema.get("allow_inf_nan", config.get("allow_inf_nan", True))
+        return lambda value: (
+            type(value) is float
+            and (not finite or math.isfinite(value))
+            and in_bounds(value)
+        )
+
+    if kind == "literal" and not extra - {"expected"}:
+        expected = schema["expected"]
+        return lambda value: any(
+            type(value) is type(e) and value == e for e in expected
+        )
+
+    if kind == "str" and extra <= {"min_length", "max_length"}:
+        if any(key in config for key in _STR_CONFIG):
+            return None
+        min_length = schema.get("min_length", 0)
+        max_length = schema.get("max_length", math.inf)
+        return lambda value: (
+            type(value) is str and min_length <= len(value) <= max_length
+        )
+
+    return None
+
+
+def _model_schema(class_: Type[BaseModel]) -> Optional[dict]:
+    """Returns the core schema of a model without model validators
+    and not frozen, None for any other model.
+    """
+    schema = class_.__pydantic_core_schema__
+    if schema["type"] == "definitions":
+        schema = schema["schema"]
+    # Model validators wrap the model schema in function schemas
+    if schema["type"] != "model" or schema["schema"]["type"] != "model-fields":
+        return None
+    if schema.get("config", {}).get("frozen", False):
+        return None
+    return schema
+
+
+@functools.lru_cache(maxsize=None)
+def fast_field_checks(class_: Type[BaseModel]) -> Dict[str, Callable[[Any], bool]]:
+    """Returns checks for the fields of a model whose valid values can
+    be assigned without calling the validator: plain bool, int, float,
+    str and Literal fields with at most bound and length constraints,
+    on models without field or model validators.
+    """
+    schema = _model_schema(class_)
+    if schema is None:
+        return {}
+    config = schema.get("config", {})
+
+    checks = {}
+    for name, field in schema["schema"]["fields"].items():
+        if field.get("frozen", False):
+            continue
+        field_schema = field["schema"]
+        if field_schema["type"] == "default":
+            field_schema = field_schema["schema"]
+        check = _field_check(field_schema, config)
+        if check is not None:
+            checks[name] = check
+    return checks
+
+
+@functools.lru_cache(maxsize=None)
+def element_fields(class_: Type[BaseModel]) -> frozenset:
+    """Returns the list, tuple and dict fields of a model that only
+    validate their elements, without constraints or field validators,
+    on models without model validators. An element validated on its
+    own can be assigned to them without validating the field.
+    """
+    schema = _model_schema(class_)
+    if schema is None:
+        return frozenset()
+
+    names = set()
+    for name, field in schema["schema"]["fields"].items():
+        if field.get("frozen", False):
+            continue
+        field_schema = field["schema"]
+        if field_schema["type"] == "default":
+            field_schema = field_schema["schema"]
+        if field_schema["type"] in ("list", "tuple", "dict") and not (
+            set(field_schema) - _NEUTRAL_KEYS - _ELEMENT_KEYS
+        ):
+            names.add(name)
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=None)
+def pure_fields(class_: Type[BaseModel]) -> frozenset:
+    """Returns the fields declared pure with `Hint(pure=True)`, whose
+    validation result only depends on the value. Models with
+    model validators have no pure fields.
+    """
+    schema = _model_schema(class_)
+    if schema is None:
+        return frozenset()
+    return frozenset(
+        name
+        for name, field in class_.model_fields.items()
+        if name in schema["schema"]["fields"]
+        and not schema["schema"]["fields"][name].get("frozen", False)
+        and field_hint(field, "pure", False)
+    )
+
+
+class ValidationCache:
+    """A bounded LRU cache of field validation results keyed by
+    model class, field name and value.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        result = self._results.get(key, None)
+        if result is None:
+            self.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: tuple, result: tuple):
+        self._results[key] = result
+        self._results.move_to_end(key)
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(hits=self.hits, misses=self.misses, size=len(self))
+
+
+class FormState:
+    """Headless editing state of a pydantic model.
+
+    Holds the model being edited and the validation errors of the
+    fields whose last input was rejected, without creating any widgets.
+    `PydanticModelEditor` renders on top of it, so replaying edits on a
+    FormState validates them exactly like the editor does.
+
+    Values that a field is known to accept unchanged, see
+    `fast_field_checks`, are assigned without calling the validator
+    unless `fast_path` is disabled. With a `cache`, the validation
+    results of fields declared pure are reused for repeated values.
+
+    FormState is not thread safe, concurrent callers have to
+    serialize their calls.
+    """
+
+    fast_path = True
+
+    cache: Optional[ValidationCache] = None
+
+    def __init__(
+        self, class_: Optional[Type[BaseModel]] = None, value: Any = None
+    ):
+        if class_ is None and isinstance(value, BaseModel):
+            class_ = type(value)
+        self.class_ = class_
+        self.value: Optional[BaseModel] = None
+        self.errors: Dict[str, list] = {}
+        self._pending: Dict[str, Any] = {}
+        self.fast_assignments = 0
+        if value is not None:
+            self.set_value(value)
+
+    @property
+    def valid(self) -> bool:
+        """Whether the last input of all fields passed validation."""
+        return not self.errors
+
+    def items(self) -> List[Tuple[str, Any]]:
+        if self.value is None:
+            return []
+        return [(name, getattr(self.value, name)) for name in self.value.model_fields]
+
+    def set_value(self, value: Any) -> Optional[BaseModel]:
+        """Replaces the model, a dict is validated into an instance
+        of `class_`. Clears all field errors.
+        """
+        if isinstance(value, dict):
+            value = self.class_(**value)
+        elif value is not None and self.class_ is not None:
+            if not isinstance(value, self.class_):
+                raise ValueError(
+                    f"value must be an instance of {self.class_}"
+                    " or a dict matching its fields."
+                )
+        elif isinstance(value, BaseModel):
+            self.class_ = type(value)
+
+        self.value = value
+        self._pending = {}
+        if self.errors:
+            self.errors = {}
+        return value
+
+    def create(self, data: Dict[str, Any]) -> bool:
+        """Creates the model from field values if there is none yet.
+
+        Returns:
+            bool: Whether a model could be created from the values.
+        """
+        try:
+            self.value = self.class_(**data)
+        except ValidationError:
+            return False
+        self._pending = {}
+        return True
+
+    def set_field(self, name: str, value: Any) -> bool:
+        """Validates a new value of a field and assigns it to the model.
+        Rejected values leave the model untouched and are recorded in
+        `errors` instead of raised.
+
+        Without a model the values are collected until they are
+        enough to create one.
+
+        Returns:
+            bool: Whether the value was accepted.
+        """
+        if self.value is None:
+            if self.class_ is None:
+                return False
+            self._pending[name] = value
+            return self.create(dict(self._pending))
+
+        # Assigning without validation needs a model of the class
+        if self.fast_path and isinstance(self.value, self.class_):
+            check = fast_field_checks(self.class_).get(name, None)
+            if check is not None and check(value):
+                self.value.__dict__[name] = value
+                self.value.__pydantic_fields_set__.add(name)
+                self.fast_assignments += 1
+                self.set_error(name, None)
+                return True
+
+        key = None
+        if self.cache is not None and name in pure_fields(self.class_):
+            # The type is part of the key, 1, 1.0 and True hash alike
+            key = (self.class_, name, type(value), value)
+            try:
+                result = self.cache.get(key)
+            except TypeError:
+                key = result = None
+            if result is not None:
+                return self._apply_result(name, result)
+
+        try:
+            self.class_.__pydantic_validator__.validate_assignment(
+                self.value, name, value
+            )
+        except ValidationError as e:
+            result = (False, e.errors(include_url=False))
+        else:
+            result = (True, getattr(self.value, name))
+
+        if key is not None:
+            self.cache.put(key, result)
+        return self._apply_result(name, result, assigned=True)
+
+    def item_assignable(self, name: str, container: Any) -> bool:
+        """Whether an element edited in `container`, the edited copy of
+        a field, can be assigned with `set_item`: the field only
+        validates its elements, has no pending error and holds the
+        same keys or number of elements as `container`.
+        """
+        if self.class_ is None or not isinstance(self.value, self.class_):
+            return False
+        if name in self.errors or name not in element_fields(self.class_):
+            return False
+        current = getattr(self.value, name)
+        if isinstance(current, dict):
+            return isinstance(container, dict) and current.keys() == container.keys()
+        return len(current) == len(container)
+
+    def set_item(self, name: str, key: Any, item: Any) -> bool:
+        """Assigns an element of a list, tuple or dict field that was
+        already validated on its own, without validating the field.
+        Check `item_assignable` first, the field's own validation is
+        skipped.
+
+        Returns:
+            bool: Whether the element was assigned.
+        """
+        if self.value is None:
+            return False
+        container = getattr(self.value, name)
+        if isinstance(container, tuple):
+            items = list(container)
+            items[key] = item
+            self.value.__dict__[name] = tuple(items)
+        else:
+            container[key] = item
+        self.value.__pydantic_fields_set__.add(name)
+        self.set_error(name, None)
+        return True
+
+    def _apply_result(self, name: str, result: tuple, assigned: bool = False) -> bool:
+        valid, outcome = result
+        if not valid:
+            self.set_error(name, outcome)
+            return False
+        if not assigned:
+            self.value.__dict__[name] = outcome
+            self.value.__pydantic_fields_set__.add(name)
+        self.set_error(name, None)
+        return True
+
+    def set_error(self, name: str, errors: Optional[list]):
+        """Records the errors of a field, None clears them."""
+        if errors is None:
+            if name in self.errors:
+                errors = dict(self.errors)
+                del errors[name]
+                self.errors = errors
+            return
+        self.errors = {**self.errors, name: errors}
+
+    def submit(self, data: Dict[str, Any]) -> bool:
+        """Applies the values of a form submission field by field.
+
+        Returns:
+            bool: Whether all fields are valid afterwards.
+        """
+        for name, value in data.items():
+            self.set_field(name, value)
+        return self.valid
+
+
+class ListState:
+    """Headless add/remove/update semantics of a list editor,
+    applied in place to the edited list.
+    """
+
+    def __init__(self, value: Optional[list] = None):
+        self.value = [] if value is None else value
+
+    def add(self, item: Any, name: Optional[Any] = None):
+        if name is None:
+            name = len(self.value)
+        self.value.insert(int(name), item)
+
+    def remove(self, name: Any) -> Any:
+        return self.value.pop(int(name))
+
+    def set(self, name: Any, item: Any):
+        self.value[int(name)] = item
+
+
+class DictState:
+    """Headless add/remove/rename/update semantics of a dict editor,
+    applied in place to the edited dict.
+    """
+
+    def __init__(self, value: Optional[dict] = None, default_key: Any = ""):
+        self.value = {} if value is None else value
+        self.default_key = default_key
+
+    def add(self, item: Any, name: Optional[Any] = None) -> Any:
+        if name is None:
+            name = self.default_key
+        self.value[name] = item
+        return name
+
+    def remove(self, name: Any) -> Any:
+        return self.value.pop(name, None)
+
+    def rename(self, name: Any, new_name: Any):
+        """Moves an item to a new key, at the end of the dict."""
+        self.value[new_name] = self.value.pop(name)
+
+    def set(self, name: Any, item: Any):
+        self.value[name] = item
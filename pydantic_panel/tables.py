@@ -0,0 +1,146 @@
+import datetime
+
+import param
+import pandas as pd
+
+from typing import Any, ClassVar, List, Optional, Type
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from panel.layout import Column, ListPanel
+from panel.widgets import CompositeWidget, Tabulator
+
+from .dispatchers import _LiteralGenericAlias
+from .state import FormState, ListState
+
+
+SCALAR_TYPES = (bool, int, float, str, datetime.date, datetime.datetime)
+
+
+def scalar_fields(class_: Type[BaseModel]) -> List[str]:
+    """Returns the names of the fields of a pydantic model
+    that can be edited in a single table cell.
+    """
+    names = []
+    for name, field in class_.model_fields.items():
+        annotation = field.annotation
+        if type(annotation) == _LiteralGenericAlias:
+            names.append(name)
+        elif isinstance(annotation, type) and issubclass(annotation, SCALAR_TYPES):
+            names.append(name)
+    return names
+
+
+class ItemTableEditor(CompositeWidget):
+    """Edits a list of pydantic models in a single table, with one
+    row per item and one column per scalar field of the model.
+
+    Edited cells are validated with the model validator and only
+    the edited item is replaced in `value`. Fields that can not be
+    rendered in a cell are not shown and are left untouched.
+    """
+
+    _composite_type: ClassVar[Type[ListPanel]] = Column
+
+    _updating = param.Boolean(False)
+
+    class_ = param.ClassSelector(class_=BaseModel, default=None, is_instance=False)
+
+    item_field = param.ClassSelector(class_=FieldInfo, default=None, allow_None=True)
+
+    columns = param.List(default=[])
+
+    item_edited = param.Event()
+
+    errors = param.Dict(
+        default={},
+        constant=True,
+        doc="""Validation errors of the last rejected edit of each cell,
+        by (row, column).""",
+    )
+
+    value = param.List(default=[])
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        if self.class_ is None and self.value:
+            self.class_ = type(self.value[0])
+
+        self._table = Tabulator(
+            value=self._frame(),
+            show_index=False,
+            editors=self._editors(),
+            sizing_mode="stretch_width",
+        )
+        self._table.on_edit(self._validate_cell)
+        self._composite[:] = [self._table]
+
+        self.param.watch(self._value_changed, "value")
+        self.param.watch(self._columns_changed, ["class_", "columns"])
+
+    @property
+    def fields(self) -> List[str]:
+        if self.class_ is None:
+            return []
+        if self.columns:
+            return list(self.columns)
+        return scalar_fields(self.class_)
+
+    def _frame(self) -> pd.DataFrame:
+        fields = self.fields
+        rows = [{name: getattr(item, name) for name in fields} for item in self.value]
+        return pd.DataFrame(rows, columns=fields)
+
+    def _editors(self) -> dict:
+        editors = {}
+        for name in self.fields:
+            annotation = self.class_.model_fields[name].annotation
+            if type(annotation) == _LiteralGenericAlias:
+                editors[name] = {"type": "list", "values": list(annotation.__args__)}
+        return editors
+
+    def _value_changed(self, *events):
+        if self._updating:
+            return
+        if self.errors:
+            with param.edit_constant(self):
+                self.errors = {}
+        self._table.value = self._frame()
+
+    def _columns_changed(self, *events):
+        self._table.editors = self._editors()
+        self._table.value = self._frame()
+
+    def _validate_cell(self, event):
+        state = FormState(self.class_, self.value[event.row].model_copy())
+        if not state.set_field(event.column, event.value):
+            self._table.patch({event.column: [(event.row, event.old)]})
+            with param.edit_constant(self):
+                self.errors = {
+                    **self.errors,
+                    (event.row, event.column): state.errors[event.column],
+                }
+            return
+
+        if (event.row, event.column) in self.errors:
+            errors = dict(self.errors)
+            del errors[(event.row, event.column)]
+            with param.edit_constant(self):
+                self.errors = errors
+
+        self._updating = True
+        try:
+            ListState(self.value).set(event.row, state.value)
+            self.param.trigger("value")
+        finally:
+            self._updating = False
+        self.item_edited = True
+
+    def add_item(self, item: BaseModel, name: Optional[Any] = None):
+        ListState(self.value).add(item, name)
+        self.param.trigger("value")
+
+    def remove_item(self, name: Any):
+        ListState(self.value).remove(name)
+        self.param.trigger("value")
@@ -0,0 +1,101 @@
+import param
+
+from typing import ClassVar, Type
+
+from panel.layout import Column, ListPanel, Row
+from panel.pane import Markdown, Str
+from panel.widgets import Button, CompositeWidget, TextAreaInput
+
+
+# Strings at least this long are edited with a LargeTextEditor
+LARGE_TEXT_THRESHOLD = 100_000
+
+# TextAreaInput requires a max_length, this is the largest the browser accepts
+UNLIMITED_LENGTH = 2**31 - 1
+
+
+def format_size(n_bytes: int) -> str:
+    size = float(n_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            break
+        size /= 1024
+    return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+
+class LargeTextEditor(CompositeWidget):
+    """Edits very large text without sending it to the browser
+    until it is needed.
+
+    By default only the size and a preview of the text are shown.
+    The full text is loaded into a text area on `Edit` and `value`
+    is only updated (and validated) on `Save`.
+    """
+
+    _composite_type: ClassVar[Type[ListPanel]] = Column
+
+    value = param.String(default="", allow_None=True)
+
+    max_length = param.Integer(default=None, allow_None=True)
+
+    preview_length = param.Integer(default=500, bounds=(0, None))
+
+    editing = param.Boolean(default=False)
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._summary = Markdown(sizing_mode="stretch_width")
+        self._preview = Str(sizing_mode="stretch_width")
+        self._text_area = None
+
+        self._edit_button = Button(name="Edit", width=80)
+        self._edit_button.on_click(self._start_editing)
+        self._save_button = Button(name="Save", button_type="primary", width=80)
+        self._save_button.on_click(self._save)
+        self._cancel_button = Button(name="Cancel", width=80)
+        self._cancel_button.on_click(self._stop_editing)
+
+        self.param.watch(self._update_summary, ["value", "name", "preview_length"])
+        self.param.watch(self._update_layout, "editing")
+        self._update_summary()
+        self._update_layout()
+
+    def _update_summary(self, *events):
+        text = self.value or ""
+        lines = text.count("\n") + 1 if text else 0
+        size = format_size(len(text.encode("utf-8", errors="replace")))
+        self._summary.object = f"**{self.name}** ({size}, {lines:,} lines)"
+
+        preview = text[: self.preview_length]
+        if len(text) > self.preview_length:
+            preview += "…"
+        self._preview.object = preview
+
+    def _update_layout(self, *events):
+        if self.editing:
+            self._composite[:] = [
+                self._summary,
+                self._text_area,
+                Row(self._save_button, self._cancel_button),
+            ]
+        else:
+            self._composite[:] = [self._summary, self._preview, self._edit_button]
+
+    def _start_editing(self, event=None):
+        # The full text is only sent to the browser from here on
+        self._text_area = TextAreaInput(
+            value=self.value or "",
+            max_length=self.max_length or UNLIMITED_LENGTH,
+            sizing_mode="stretch_width",
+            height=400,
+        )
+        self.editing = True
+
+    def _stop_editing(self, event=None):
+        self.editing = False
+        self._text_area = None
+
+    def _save(self, event=None):
+        if self._text_area is not None:
+            self.value = self._text_area.value
+        self._stop_editing()
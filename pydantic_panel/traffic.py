@@ -0,0 +1,99 @@
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, List, Optional
+
+from bokeh.document import Document
+from bokeh.document.events import DocumentPatchedEvent
+from bokeh.protocol import Protocol
+
+
+class TrafficRecord:
+    """The Bokeh document traffic caused by one operation.
+
+    `events` counts the document change events, `models` the distinct
+    models they patched and `bytes` the size of the PATCH-DOC messages
+    the events serialize to. Events held and combined by the document
+    are counted as they happen, so `bytes` is an upper bound of what
+    is sent over the websocket.
+    """
+
+    __slots__ = ("operation", "events", "models", "bytes", "_seen", "_model_ids")
+
+    def __init__(self, operation: Optional[str] = None):
+        self.operation = operation
+        self.events = 0
+        self.models = 0
+        self.bytes = 0
+        self._seen = []
+        self._model_ids = set()
+
+    def __repr__(self):
+        return (
+            f"TrafficRecord(operation={self.operation!r}, events={self.events}, "
+            f"models={self.models}, bytes={self.bytes})"
+        )
+
+    def _record(self, event):
+        # Held events are triggered again when the hold is released
+        if any(event is seen for seen in self._seen):
+            return
+        self._seen.append(event)
+        self.events += 1
+
+        model = getattr(event, "model", None)
+        if model is not None and model.id not in self._model_ids:
+            self._model_ids.add(model.id)
+            self.models += 1
+
+        if isinstance(event, DocumentPatchedEvent):
+            try:
+                message = Protocol().create("PATCH-DOC", [event])
+            except Exception:
+                return
+            self.bytes += (
+                len(message.header_json)
+                + len(message.metadata_json)
+                + len(message.content_json)
+                + sum(len(buffer.data) for buffer in message.buffers)
+            )
+
+
+def documents(viewable) -> List[Document]:
+    """Returns the documents a panel component is rendered in."""
+    docs = {}
+    for obj in (viewable, getattr(viewable, "_composite", None)):
+        for model, _ in getattr(obj, "_models", {}).values():
+            if model.document is not None:
+                docs[id(model.document)] = model.document
+    return list(docs.values())
+
+
+@contextmanager
+def _watch_document(doc: Document, record: TrafficRecord):
+    callbacks = doc.callbacks
+    patched = "trigger_on_change" in vars(callbacks)
+    trigger = callbacks.trigger_on_change
+
+    def trigger_on_change(event):
+        record._record(event)
+        trigger(event)
+
+    callbacks.trigger_on_change = trigger_on_change
+    try:
+        yield
+    finally:
+        if patched:
+            callbacks.trigger_on_change = trigger
+        else:
+            del callbacks.trigger_on_change
+
+
+@contextmanager
+def recording(viewable, operation: Optional[str] = None) -> Iterator[TrafficRecord]:
+    """Records the document traffic of the operations run inside the
+    context in all documents the component is rendered in.
+    """
+    record = TrafficRecord(operation)
+    with ExitStack() as stack:
+        for doc in documents(viewable):
+            stack.enter_context(_watch_document(doc, record))
+        yield record
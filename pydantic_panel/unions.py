@@ -0,0 +1,182 @@
+import types
+
+from collections import OrderedDict
+from typing import Any, ClassVar, Optional, Tuple, Type, Union, get_args, get_origin
+
+import param
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from panel.layout import Column, ListPanel
+from panel.widgets import CompositeWidget, Select, Widget
+
+from .dispatchers import _LiteralGenericAlias, clean_kwargs, infer_widget
+
+
+# X | Y annotations have their own origin since Python 3.10
+UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+
+def union_variants(annotation: Any) -> Tuple[type, ...]:
+    """Returns the variants of a union annotation, ignoring None.
+    Optionals of a single type are not considered unions.
+    """
+    if get_origin(annotation) not in UNION_TYPES:
+        return ()
+    variants = tuple(a for a in get_args(annotation) if a is not type(None))
+    return variants if len(variants) > 1 else ()
+
+
+def _instance_of(value: Any, variant: type) -> bool:
+    try:
+        return isinstance(value, get_origin(variant) or variant)
+    except TypeError:
+        return False
+
+
+class UnionEditor(CompositeWidget):
+    """Edits a union-typed field with a selector of the variants
+    and the editor of the selected variant.
+
+    Only the editor of the selected variant is built. Editors of
+    other variants are built when they are selected and the
+    `cache_size` most recently used inactive ones are kept around.
+    """
+
+    _composite_type: ClassVar[Type[ListPanel]] = Column
+
+    variants = param.List(default=[])
+
+    discriminator = param.String(default=None, allow_None=True)
+
+    cache_size = param.Integer(
+        default=2,
+        bounds=(0, None),
+        doc="Number of editors of inactive variants kept for reuse.",
+    )
+
+    value = param.Parameter(default=None)
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._updating = False
+        self._editors = OrderedDict()
+        self._watcher = None
+
+        active = self.variant_for(self.value) or self.variants[0]
+        self._selector = Select(
+            name=self.name,
+            options={self.variant_label(v): v for v in self.variants},
+            value=active,
+        )
+        self._selector.param.watch(self._variant_selected, "value")
+        self.param.watch(self._value_changed, "value")
+        self._activate(active)
+
+    @property
+    def active(self) -> type:
+        return self._selector.value
+
+    @property
+    def editor(self) -> Widget:
+        return self._editors[self.active]
+
+    def variant_label(self, variant: type) -> str:
+        if self.discriminator and isinstance(variant, type):
+            fields = getattr(variant, "model_fields", {})
+            field = fields.get(self.discriminator, None)
+            if field is not None and type(field.annotation) == _LiteralGenericAlias:
+                return str(field.annotation.__args__[0])
+        return getattr(variant, "__name__", str(variant))
+
+    def variant_for(self, value: Any) -> Optional[type]:
+        if value is None:
+            return None
+        # Exact type matches win over subclasses, e.g. bool over int
+        for variant in self.variants:
+            if type(value) is variant:
+                return variant
+        for variant in self.variants:
+            if _instance_of(value, variant):
+                return variant
+        return None
+
+    def _build(self, variant: type) -> Widget:
+        value = self.value if _instance_of(self.value, variant) else None
+        if value is None and isinstance(variant, type):
+            try:
+                value = variant()
+            except Exception:
+                value = None
+        if value is None and isinstance(variant, type) and issubclass(variant, BaseModel):
+            return infer_widget.invoke(variant, None)(None, None, class_=variant, name="")
+        return infer_widget(value, None, name="")
+
+    def _activate(self, variant: type):
+        editor = self._editors.pop(variant, None)
+        if editor is None:
+            editor = self._build(variant)
+        self._editors[variant] = editor
+
+        # The least recently used inactive editors beyond the cache size go
+        inactive = [v for v in self._editors if v is not variant]
+        for stale in inactive[: max(0, len(inactive) - self.cache_size)]:
+            removed = self._editors.pop(stale)
+            if hasattr(removed, "teardown"):
+                removed.teardown()
+
+        if self._watcher is not None:
+            self._watcher[0].param.unwatch(self._watcher[1])
+        self._watcher = (editor, editor.param.watch(self._editor_changed, "value"))
+        self._composite[:] = [self._selector, editor]
+        return editor
+
+    def _variant_selected(self, event):
+        if self._updating:
+            return
+        editor = self._activate(event.new)
+        if editor.value is not None:
+            self._set_value(editor.value)
+
+    def _editor_changed(self, event):
+        if not self._updating and event.new is not None:
+            self._set_value(event.new)
+
+    def _set_value(self, value: Any):
+        self._updating = True
+        try:
+            self.value = value
+        finally:
+            self._updating = False
+
+    def _value_changed(self, event):
+        if self._updating or event.new is None:
+            return
+        variant = self.variant_for(event.new)
+        if variant is None:
+            return
+        self._updating = True
+        try:
+            if variant is not self.active:
+                self._selector.value = variant
+                self._activate(variant)
+            self.editor.value = event.new
+        finally:
+            self._updating = False
+
+    def teardown(self):
+        for editor in self._editors.values():
+            if hasattr(editor, "teardown"):
+                editor.teardown()
+
+
+def infer_union_widget(value: Any, field: FieldInfo, **kwargs) -> Widget:
+    """Returns a UnionEditor for a field annotated with a union."""
+    kwargs.setdefault("discriminator", getattr(field, "discriminator", None))
+    if not isinstance(kwargs["discriminator"], str):
+        kwargs["discriminator"] = None
+    kwargs = clean_kwargs(UnionEditor, kwargs)
+    return UnionEditor(
+        value=value, variants=list(union_variants(field.annotation)), **kwargs
+    )
@@ -1,10 +1,17 @@
 from ast import Import
+from contextlib import contextmanager
+from functools import partial
+import inspect
+import itertools
+import os
+import threading
+import weakref
 import param
 import pydantic
 
-from typing import Dict, List, Any, Optional, Type, ClassVar
+from typing import Dict, List, Any, Optional, Type, ClassVar, get_args
 
-from pydantic import ValidationError, BaseModel
+from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
 from plum import dispatch, NotFoundLookupError
@@ -15,9 +22,17 @@ import panel as pn
 
 from panel.layout import Column, Divider, ListPanel, Card
 
+from panel.io.callbacks import PeriodicCallback
 from panel.widgets import CompositeWidget, Button
 
 from .dispatchers import infer_widget, clean_kwargs
+from .hints import field_hint
+from .autosave import AutoSaver, ModelStore, model_key, store_for
+from .changes import ChangeEvent, ChangeStream
+from .shared import SharedModel, _schedule
+from .state import DictState, FormState, ListState, ValidationCache
+from .traffic import recording
+from .unions import infer_union_widget, union_variants
 
 from pydantic_panel import infer_widget
 from typing import ClassVar, Type, List, Dict, Tuple, Any
@@ -86,14 +101,24 @@ class pydantic_widgets(param.ParameterizedFunction):
             if value is None:
                 value = field.default
 
-            try:
-                widget_builder = infer_widget.invoke(field.annotation, field.__class__)
-                widget = widget_builder(
+            if union_variants(field.annotation):
+                widget = infer_union_widget(
                     value, field, name=field_name, **p.widget_kwargs
                 )
 
-            except (NotFoundLookupError, NotImplementedError):
-                widget = infer_widget(value, field, name=field_name, **p.widget_kwargs)
+            else:
+                try:
+                    widget_builder = infer_widget.invoke(
+                        field.annotation, field.__class__
+                    )
+                    widget = widget_builder(
+                        value, field, name=field_name, **p.widget_kwargs
+                    )
+
+                except (NotFoundLookupError, NotImplementedError):
+                    widget = infer_widget(
+                        value, field, name=field_name, **p.widget_kwargs
+                    )
 
             if p.callback is not None:
                 widget.param.watch(p.callback, "value")
@@ -113,9 +138,6 @@ class PydanticModelEditor(CompositeWidget):
 
     _widgets = param.Dict(default={}, constant=True)
 
-    _updating = param.Boolean(False)
-    _updating_field = param.Boolean(False)
-
     class_ = param.ClassSelector(class_=BaseModel, default=None, is_instance=False)
 
     fields = param.List([])
@@ -124,10 +146,87 @@ class PydanticModelEditor(CompositeWidget):
 
     bidirectional = param.Boolean(False)
 
+    bidirectional_interval = param.Number(
+        default=None,
+        allow_None=True,
+        bounds=(0, None),
+        doc="""Seconds over which changes made directly to the model are
+        coalesced before the widgets are updated with the latest value of
+        each changed field. None updates the widgets on every assignment.""",
+    )
+
+    autosave = param.ClassSelector(
+        class_=(str, os.PathLike, ModelStore),
+        default=None,
+        doc="""A JSON file, SQLite database (.db/.sqlite) or ModelStore
+        the model is saved to on changes and restored from on construction.""",
+    )
+
+    autosave_interval = param.Number(default=1.0, bounds=(0, None))
+
+    errors = param.Dict(
+        default={},
+        constant=True,
+        doc="""Validation errors of the fields whose widget holds invalid
+        input, as returned by ValidationError.errors().""",
+    )
+
+    shared = param.ClassSelector(
+        class_=SharedModel,
+        default=None,
+        doc="""A model shared with the editors of other sessions, edits
+        are validated once on it and sent to all attached editors.""",
+    )
+
+    fast_validation = param.Boolean(
+        default=True,
+        doc="""Assign values that plain bool, int, float, str and Literal
+        fields are known to accept without calling the model validator.""",
+    )
+
+    validation_cache_size = param.Integer(
+        default=None,
+        allow_None=True,
+        bounds=(1, None),
+        doc="""Size of an LRU cache of the validation results of fields
+        declared pure with Hint(pure=True), None disables the cache.""",
+    )
+
+    progressive = param.Boolean(
+        default=False,
+        doc="""Build the widgets of the first `batch_size` fields right away
+        and the others in batches on the following ticks once the editor
+        is rendered, showing placeholders until then.""",
+    )
+
+    batch_size = param.Integer(default=10, bounds=(1, None))
+
     value = param.ClassSelector(class_=(BaseModel, dict))
 
     def __init__(self, **params):
-
+        shared = params.get("shared", None)
+        if shared is not None:
+            params.setdefault("class_", shared.class_)
+            params["value"] = shared.value
+
+        # Re-entrancy flags are per thread so an update running on one
+        # thread never swallows an edit arriving on another
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._autosaver = None
+        self._torn_down = False
+        self._pending_fields = set()
+        self._flush_timer = None
+        self._flush_scheduled = False
+        self._flush_lock = threading.Lock()
+        self._document = None
+        self._state = FormState()
+        self._unbuilt = []
+        self._placeholders = {}
+        self._batch_scheduled = False
+        self.traffic = []
+        self._change_streams = []
+        self._change_parent = None
         super().__init__(**params)
         self._recreate_widgets()
         self.param.watch(self._recreate_widgets, self._trigger_recreate)
@@ -137,31 +236,213 @@ class PydanticModelEditor(CompositeWidget):
         if self.value is not None:
             self.param.trigger("value")
 
-        for w in self.widgets:
-            w.param.trigger("value")
+        # Widgets of a shared model are built from its validated values
+        if self.shared is None:
+            for w in self.widgets:
+                w.param.trigger("value")
+
+        if self.autosave is not None:
+            self._setup_autosave()
+
+        if self.shared is not None:
+            self.shared.attach(self)
+
+    @param.depends("fast_validation", watch=True, on_init=True)
+    def _fast_validation_changed(self):
+        self._state.fast_path = self.fast_validation
+
+    @param.depends("validation_cache_size", watch=True, on_init=True)
+    def _validation_cache_changed(self):
+        size = self.validation_cache_size
+        self._state.cache = None if size is None else ValidationCache(size)
+
+    @property
+    def validation_stats(self) -> Dict[str, int]:
+        """Hits, misses and size of the validation cache."""
+        if self._state.cache is None:
+            return dict(hits=0, misses=0, size=0)
+        return self._state.cache.stats()
+
+    def _setup_autosave(self):
+        class_ = self.class_
+        if class_ is None and isinstance(self.value, BaseModel):
+            class_ = type(self.value)
+        if class_ is None:
+            raise ValueError("autosave requires class_ or a model value.")
+
+        autosaver = AutoSaver(
+            store_for(self.autosave),
+            model_key(class_),
+            interval=self.autosave_interval,
+        )
+        restored = autosaver.restore(class_)
+        if restored is not None:
+            self.value = restored
+        self._autosaver = autosaver
+
+    @property
+    def _updating(self) -> bool:
+        return getattr(self._local, "updating", False)
+
+    @_updating.setter
+    def _updating(self, updating: bool):
+        self._local.updating = updating
+
+    @property
+    def _updating_field(self) -> bool:
+        return getattr(self._local, "updating_field", False)
+
+    @_updating_field.setter
+    def _updating_field(self, updating: bool):
+        self._local.updating_field = updating
+
+    def _model_lock(self) -> threading.RLock:
+        """The lock serializing changes to the current model, shared
+        with other editors and with setattr on a synced model.
+        """
+        if isinstance(self.value, BaseModel):
+            return _model_sync(self.value).lock
+        return self._lock
+
+    def _schedule_autosave(self):
+        if self._autosaver is not None and isinstance(self.value, BaseModel):
+            self._autosaver.schedule(self.value)
 
     @property
     def widgets(self):
         fields = self.fields if self.fields else list(self._widgets)
         return [self._widgets[field] for field in fields if field in self._widgets]
-    
-    def _recreate_widgets(self, *events):
-        if self.class_ is None:
-            self.value = None
-            return
 
+    def _build_widgets(self, names: List[str]) -> Dict[str, Any]:
         widgets = pydantic_widgets(
             model=self.class_,
+            aliases={name: name for name in names},
             defaults=dict(self.items()),
             callback=self._validate_field,
             use_model_aliases=self.by_alias,
             widget_kwargs=dict(bidirectional=self.bidirectional),
         )
+        # Changes made in nested editors are published with their path
+        for name, widget in widgets.items():
+            if isinstance(widget, PydanticModelEditor):
+                widget._change_parent = (weakref.ref(self), name)
+        return widgets
+
+    def _recreate_widgets(self, *events):
+        self._state.class_ = self.class_
+        if self.class_ is None:
+            self.value = None
+            return
+
+        # Only a change of class_ keeps widgets, other callers need
+        # widgets with freshly registered watchers
+        old_class = events[0].old if events else None
+        reused = self._reusable_widgets(old_class)
+
+        names = [name for name in self.class_.model_fields if name not in reused]
+        if self.progressive:
+            # Nested editors are the slowest to build, they come last
+            order = sorted(names, key=lambda name: _is_nested(self.class_, name))
+            names, self._unbuilt = order[: self.batch_size], order[self.batch_size :]
+        else:
+            self._unbuilt = []
+
+        widgets = {**reused, **self._build_widgets(names)}
+        if old_class is not None:
+            self._discard_widgets(
+                w for n, w in self._widgets.items() if reused.get(n) is not w
+            )
 
         with param.edit_constant(self):
-            self._widgets = widgets
+            self._widgets = {n: widgets[n] for n in self.class_.model_fields if n in widgets}
+
+        self._placeholders = {}
+        self._update_layout()
+
+        if old_class is not None and self.value is not None:
+            # A model of the old class, even one that is an instance of
+            # the new class, is rebuilt from the kept widgets and the
+            # defaults of the new fields
+            if isinstance(self.value, old_class) or not isinstance(
+                self.value, self.class_
+            ):
+                data = {name: widget.value for name, widget in reused.items()}
+                self.value = self._state.value if self._state.create(data) else None
+
+    def _reusable_widgets(self, old_class: Optional[type]) -> Dict[str, Any]:
+        """Returns the widgets of the fields the previous class shares
+        with the current one, same name, type and constraints, which
+        would be rebuilt as the same widget.
+        """
+        if not (isinstance(old_class, type) and issubclass(old_class, BaseModel)):
+            return {}
+        reused = {}
+        for name, field in self.class_.model_fields.items():
+            old_field = old_class.model_fields.get(name, None)
+            widget = self._widgets.get(name, None)
+            if widget is None or old_field is None:
+                continue
+            if _field_signature(old_field) == _field_signature(field):
+                reused[name] = widget
+        return reused
+
+    def _discard_widgets(self, widgets):
+        for widget in widgets:
+            _unwatch(widget, self._validate_field)
+            if hasattr(widget, "teardown"):
+                widget.teardown()
+
+    def _update_layout(self):
+        if not self._unbuilt:
+            self._composite[:] = self.widgets
+            return
 
-        self._composite[:] = self.widgets
+        fields = self.fields if self.fields else list(self.class_.model_fields)
+        layout = []
+        for name in fields:
+            if name in self._widgets:
+                layout.append(self._widgets[name])
+            elif name in self._unbuilt:
+                if name not in self._placeholders:
+                    self._placeholders[name] = pn.pane.Markdown(
+                        name.replace("_", " ").capitalize(),
+                        loading=True,
+                        min_height=40,
+                    )
+                layout.append(self._placeholders[name])
+        self._composite[:] = layout
+
+    def _build_next_batch(self):
+        """Builds the widgets of the next `batch_size` unbuilt fields."""
+        if not self._unbuilt or self.class_ is None:
+            return
+        names = self._unbuilt[: self.batch_size]
+        self._unbuilt = self._unbuilt[self.batch_size :]
+        widgets = {**self._widgets, **self._build_widgets(names)}
+        with param.edit_constant(self):
+            self._widgets = {
+                n: widgets[n] for n in self.class_.model_fields if n in widgets
+            }
+        for name in names:
+            self._placeholders.pop(name, None)
+        self._update_layout()
+
+    def materialize(self):
+        """Builds the widgets of all fields not built yet."""
+        while self._unbuilt:
+            self._build_next_batch()
+
+    def _schedule_batches(self, doc):
+        if self._batch_scheduled or not self._unbuilt:
+            return
+        self._batch_scheduled = True
+
+        def build_batch():
+            self._batch_scheduled = False
+            self._build_next_batch()
+            self._schedule_batches(doc)
+
+        _schedule(doc, build_batch)
 
     def _update_value(self, event: param.Event):
 
@@ -169,6 +450,8 @@ class PydanticModelEditor(CompositeWidget):
             return
 
         if self.value is None:
+            self._state.set_value(None)
+            self._publish_errors()
             for widget in self.widgets:
                 try:
                     widget.value = None
@@ -180,9 +463,14 @@ class PydanticModelEditor(CompositeWidget):
             self.class_ = type(self.value)
 
         if isinstance(self.value, self.class_):
+            self._state.set_value(self.value)
+            self._publish_errors()
             for k, v in self.items():
                 if k in self._widgets:
                     self._widgets[k].value = v
+                elif k in self._unbuilt:
+                    # Built from the model value when its batch comes
+                    continue
                 else:
                     self._recreate_widgets()
                     self.param.trigger("value")
@@ -199,6 +487,12 @@ class PydanticModelEditor(CompositeWidget):
                 " or a dict matching its fields."
             )
 
+        self._schedule_autosave()
+        self._link_model(event.old)
+        if self._observed():
+            self._publish_change((), event.old, self.value)
+
+    def _link_model(self, old: Any):
         # HACK for biderectional sync
         if self.value is not None and self.bidirectional:
 
@@ -215,12 +509,151 @@ class PydanticModelEditor(CompositeWidget):
 
             # If the previous value was a model
             # instance we unlink it
-            if id(self.value) != id(event.old) and isinstance(event.old, BaseModel):
-                remove_setattr_callback(event.old, self._update_widget)
+            if id(self.value) != id(old) and isinstance(old, BaseModel):
+                remove_setattr_callback(old, self._update_widget)
 
-    def __del__(self):
-        if self.value is not None and self.bidirectional:
+    def stream(self, source, interval: float = 0.05) -> PeriodicCallback:
+        """Applies the model instances produced by a sync iterable or
+        an async generator to the editor.
+
+        Instances are coalesced so at most one is applied every `interval`
+        seconds, the latest one winning, and only the widgets of fields
+        whose value changed are updated. Sync iterables are consumed on
+        a background thread.
+
+        Returns:
+            PeriodicCallback: The callback applying the instances, it
+                stops once the source is exhausted.
+        """
+        stream = _ModelStream()
+
+        def apply():
+            model, done = stream.pop()
+            if model is not None:
+                self._apply_streamed(model)
+            if done:
+                callback.stop()
+
+        callback = pn.state.add_periodic_callback(apply, period=int(interval * 1000))
+
+        if hasattr(source, "__aiter__"):
+
+            async def consume():
+                try:
+                    async for model in source:
+                        stream.push(model)
+                finally:
+                    stream.close()
+
+            pn.state.execute(consume)
+        else:
+
+            def consume():
+                try:
+                    for model in source:
+                        stream.push(model)
+                finally:
+                    stream.close()
+
+            threading.Thread(target=consume, daemon=True).start()
+
+        return callback
+
+    def _apply_streamed(self, model: BaseModel):
+        if not isinstance(self.value, BaseModel) or not isinstance(model, self.class_):
+            self.value = model
+            return
+
+        self._updating = True
+        try:
+            with self._model_lock():
+                for name in type(model).model_fields:
+                    new = getattr(model, name)
+                    if name in self._widgets and new != getattr(self.value, name):
+                        self._widgets[name].value = new
+        finally:
+            self._updating = False
+
+        old = self.value
+        self._state.set_value(model)
+        self._publish_errors()
+
+        # Widgets are already in sync, skip the full _update_value
+        self._updating_field = True
+        try:
+            self.value = model
+        finally:
+            self._updating_field = False
+        self._link_model(old)
+        self._schedule_autosave()
+        if self._observed():
+            self._publish_change((), old, model)
+
+    def changes(self, maxsize: int = 1000, overflow: str = "coalesce") -> ChangeStream:
+        """Returns an async iterator of the validated changes made in the
+        editor and its nested editors, see ChangeStream.
+
+        Events are buffered up to `maxsize`, so slow consumers never
+        block an edit. `overflow` is either `coalesce`, merging pending
+        changes of the same field, or `drop_oldest`.
+        """
+        stream = ChangeStream(maxsize=maxsize, overflow=overflow)
+        self._change_streams.append(stream)
+        return stream
+
+    def _observed(self) -> bool:
+        return bool(self._change_streams) or self._change_parent is not None
+
+    def _current_model(self) -> Optional[BaseModel]:
+        return self.value if isinstance(self.value, BaseModel) else None
+
+    def _publish_change(self, path: Tuple[str, ...], old: Any, new: Any):
+        streams = [stream for stream in self._change_streams if not stream.closed]
+        self._change_streams = streams
+        for stream in streams:
+            stream.push(ChangeEvent(path, old, new, self._current_model))
+
+        if self._change_parent is not None:
+            parent, name = self._change_parent[0](), self._change_parent[1]
+            if parent is not None and parent._observed():
+                parent._publish_change((name, *path), old, new)
+
+    def teardown(self):
+        """Unregisters the watchers and callbacks of the editor and its
+        widgets so that nothing outside the editor references it.
+        Rendering the editor again sets them up anew.
+        """
+        if isinstance(self.value, BaseModel):
             remove_setattr_callback(self.value, self._update_widget)
+        if self.shared is not None:
+            self.shared.detach(self)
+        for widget in self._widgets.values():
+            _unwatch(widget, self._validate_field)
+            if hasattr(widget, "teardown"):
+                widget.teardown()
+        if self._autosaver is not None:
+            self._autosaver.flush()
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._flush_scheduled = False
+        self._document = None
+        for stream in self._change_streams:
+            stream.close()
+        self._change_streams = []
+        self._torn_down = True
+
+    def _get_model(self, doc, root=None, parent=None, comm=None):
+        if self._torn_down:
+            self._torn_down = False
+            self._recreate_widgets()
+            self.param.trigger("value")
+            if self.shared is not None:
+                self.shared.attach(self, doc)
+        model = super()._get_model(doc, root, parent, comm)
+        self._document = doc
+        self._schedule_batches(doc)
+        return model
 
     def items(self):
         if self.value is None:
@@ -234,41 +667,86 @@ class PydanticModelEditor(CompositeWidget):
 
         if self.value is None:
             if self.class_ is not None:
-                try:
-                    data = {k: w.value for k, w in self._widgets.items()}
-                    self.value = self.class_(**data)
-                except:
-                    pass
+                data = {k: w.value for k, w in self._widgets.items()}
+                if self._state.create(data):
+                    self.value = self._state.value
             return
 
-        if self.value is None:
-            return
-        
         for name, widget in self._widgets.items():
             if event.obj == widget:
                 break
         else:
             return
 
-        try:
-            self.class_.__pydantic_validator__.validate_assignment(self.value, 
-                                                                   name, 
-                                                                   event.new)
-        except ValidationError as e:
-            self._updating = True
-            try:
-                event.obj.value = event.old
-                self._updating_field = True
-                self.param.trigger("value")
-                self._updating_field = False
-            finally:
-                self._updating = False
-            raise e
+        observed = self._observed()
+
+        edit = getattr(widget, "validated_edit", None)
+        if edit is not None and self.shared is None:
+            # Only the edited element changed and it was validated by
+            # the widget, fields validating just their elements are
+            # not validated again
+            key, item = edit
+            with self._model_lock():
+                accepted = self._state.item_assignable(name, event.new)
+                if accepted:
+                    old = getattr(self.value, name)[key] if observed else None
+                    self._state.set_item(name, key, item)
+                    self._publish_errors()
+            if accepted:
+                if observed:
+                    self._publish_change((name, key), old, item)
+                self._schedule_autosave()
+                return
+
+        old = getattr(self.value, name, None) if observed else None
+
+        if self.shared is not None:
+            errors = self.shared.set_field(name, event.new, source=self)
+            with self._lock:
+                self._state.set_error(name, errors)
+                self._publish_errors()
+            if errors is None and observed:
+                self._publish_change((name,), old, getattr(self.value, name))
+            return
+
+        with self._model_lock():
+            # The model keeps its last valid value, errors are
+            # published on `errors` instead of raised in the watcher
+            accepted = self._state.set_field(name, event.new)
+            self._publish_errors()
+        if accepted:
+            if observed:
+                self._publish_change((name,), old, getattr(self.value, name))
+            self._schedule_autosave()
+
+    def _publish_errors(self):
+        with self._lock:
+            if self.errors != self._state.errors:
+                with param.edit_constant(self):
+                    self.errors = self._state.errors
+
+    @property
+    def valid(self) -> bool:
+        """Whether the input of all widgets passed validation."""
+        return not self.errors
 
     def _update_widget(self, name, value):
         if self._updating:
             return
 
+        if self.bidirectional_interval is not None:
+            self._queue_widget_update(name)
+            return
+
+        if name in self._widgets:
+            self._updating = True
+            try:
+                self._widgets[name].value = value
+            finally:
+                self._updating = False
+            self._schedule_autosave()
+
+    def _apply_shared(self, name, value):
         if name in self._widgets:
             self._updating = True
             try:
@@ -276,6 +754,57 @@ class PydanticModelEditor(CompositeWidget):
             finally:
                 self._updating = False
 
+    def _queue_widget_update(self, name):
+        with self._lock:
+            self._pending_fields.add(name)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+            doc = self._document
+            if doc is not None and doc.session_context is not None:
+                # Next tick callbacks are the only ones that can be added
+                # from any thread, the timeout then flushes on the
+                # document's event loop while holding its lock
+                doc.add_next_tick_callback(
+                    partial(
+                        doc.add_timeout_callback,
+                        self._flush_widget_updates,
+                        int(self.bidirectional_interval * 1000),
+                    )
+                )
+                return
+            self._flush_timer = threading.Timer(
+                self.bidirectional_interval, self._flush_widget_updates
+            )
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_widget_updates(self):
+        """Updates the widgets of the fields changed on the model since
+        the last flush with the current value of the field.
+        """
+        # Serialize flushes so an older one never finishes last
+        with self._flush_lock:
+            with self._lock:
+                names, self._pending_fields = self._pending_fields, set()
+                self._flush_scheduled = False
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if self._torn_down or not isinstance(self.value, BaseModel):
+                return
+
+            self._updating = True
+            try:
+                with self._model_lock():
+                    for name in names:
+                        if name in self._widgets:
+                            self._widgets[name].value = getattr(self.value, name)
+            finally:
+                self._updating = False
+        if names:
+            self._schedule_autosave()
+
     def _update_widgets(self, cls, values):
         if self.value is None:
             return
@@ -296,6 +825,15 @@ class PydanticModelEditor(CompositeWidget):
 
         return values
 
+    @contextmanager
+    def record_traffic(self, operation: Optional[str] = None):
+        """Records the Bokeh document traffic of the operations run
+        inside the context, the TrafficRecord is appended to `traffic`.
+        """
+        with recording(self, operation) as record:
+            yield record
+        self.traffic.append(record)
+
     @pn.depends("value")
     def json(self):
         if self.value is None:
@@ -315,6 +853,100 @@ class PydanticModelEditor(CompositeWidget):
         )
 
 
+def _field_signature(field: FieldInfo) -> tuple:
+    """The parts of a field that determine the widget built for it."""
+    return (
+        field.annotation,
+        repr(field.metadata),
+        repr(field.json_schema_extra),
+        field.discriminator,
+        field.alias,
+    )
+
+
+def _is_nested(class_: Type[BaseModel], name: str) -> bool:
+    """Whether a field holds models or collections of models."""
+    annotation = class_.model_fields[name].annotation
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(
+        isinstance(arg, type) and issubclass(arg, BaseModel)
+        for arg in getattr(annotation, "__args__", ())
+    )
+
+
+class _ModelSync:
+    """The lock and setattr callbacks of a model instance."""
+
+    __slots__ = ("lock", "callbacks")
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.callbacks = []
+
+
+# Sync state per model instance, keyed by id and removed
+# when the instance is garbage collected
+_model_syncs: Dict[int, _ModelSync] = {}
+
+_registry_lock = threading.Lock()
+
+_synced_classes: Dict[type, type] = {}
+
+
+def _model_sync(model_instance: BaseModel) -> _ModelSync:
+    key = id(model_instance)
+    with _registry_lock:
+        sync = _model_syncs.get(key)
+        if sync is None:
+            sync = _model_syncs[key] = _ModelSync()
+            weakref.finalize(model_instance, _model_syncs.pop, key, None)
+        return sync
+
+
+def _callback_ref(callback: callable):
+    """Weak reference to bound methods so a model does not keep
+    the editors observing it alive. Other callables are kept alive.
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+
+def _synced_class(class_: type) -> type:
+    """Returns a subclass of a pydantic model that calls the setattr
+    callbacks registered for an instance after each assignment.
+    """
+    if getattr(class_, "__panel_synced__", False):
+        return class_
+
+    with _registry_lock:
+        if class_ not in _synced_classes:
+
+            class ModifiedModel(class_):
+                __panel_synced__ = True
+
+                def __setattr__(self, name, value):
+                    sync = _model_syncs.get(id(self))
+                    if sync is None:
+                        super().__setattr__(name, value)
+                        return
+                    # Assignment and widget sync happen atomically so
+                    # concurrent writers leave widgets in the final state
+                    with sync.lock:
+                        super().__setattr__(name, value)
+                        for ref in tuple(sync.callbacks):
+                            cb = ref()
+                            if cb is not None:
+                                cb(name, value)
+
+            ModifiedModel.__name__ = class_.__name__
+            ModifiedModel.__qualname__ = class_.__qualname__
+            _synced_classes[class_] = ModifiedModel
+
+        return _synced_classes[class_]
+
+
 def add_setattr_callback(model_instance: BaseModel, callback: callable):
     """Syncs the fields of a pydantic model with a dictionary of widgets
 
@@ -325,25 +957,17 @@ def add_setattr_callback(model_instance: BaseModel, callback: callable):
     Returns:
         callback: A callback function that can be used to unsync the fields
     """
-
-    class_ = model_instance.__class__
-    if hasattr(class_, "__panel_callbacks__"):
-        class_.__panel_callbacks__ += (callback,)
-    else:
-        class ModifiedModel(class_):
-            __panel_callbacks__ = (callback,)
-
-            def __setattr__(self, name, value):
-                super().__setattr__(name, value)
-                if not hasattr(self.__class__, "__panel_callbacks__"):
-                    return
-                for cb in self.__class__.__panel_callbacks__:
-                    cb(name, value)
-    
-    model_instance.__class__ = ModifiedModel
+    sync = _model_sync(model_instance)
+    with sync.lock:
+        refs = sync.callbacks
+        refs[:] = [ref for ref in refs if ref() is not None]
+        if not any(ref() == callback for ref in refs):
+            refs.append(_callback_ref(callback))
+        model_instance.__class__ = _synced_class(model_instance.__class__)
 
     return callback
 
+
 def remove_setattr_callback(model_instance: BaseModel, callback: callable):
     """Unsyncs the fields of a pydantic model with a dictionary of widgets
 
@@ -353,22 +977,50 @@ def remove_setattr_callback(model_instance: BaseModel, callback: callable):
     Returns:
         None
     """
-    class_ = model_instance.__class__
-
-    if hasattr(class_, "__panel_callbacks__"):
-            class_.__panel_callbacks__ = tuple(
-                cb for cb in class_.__panel_callbacks__ if cb is not callback
-            )
-    else:
+    sync = _model_syncs.get(id(model_instance))
+    if sync is None:
         return
-    
-    if class_.__panel_callbacks__:
-        return
-    
-    for class_ in model_instance.__class__.mro():
-        if hasattr(class_, "__panel_callbacks__"):
-            continue
-        model_instance.__class__ = class_
+
+    with sync.lock:
+        refs = sync.callbacks
+        refs[:] = [ref for ref in refs if ref() is not None and ref() != callback]
+        if refs:
+            return
+
+        class_ = model_instance.__class__
+        if getattr(class_, "__panel_synced__", False):
+            model_instance.__class__ = class_.__bases__[0]
+
+
+def _unwatch(widget: param.Parameterized, fn: callable):
+    """Removes all watchers calling `fn` from a widget."""
+    for whats in widget.param.watchers.values():
+        for watchers in whats.values():
+            for watcher in list(watchers):
+                if watcher.fn == fn:
+                    widget.param.unwatch(watcher)
+
+
+class _ModelStream:
+    """Thread safe holder of the latest model of a stream."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest = None
+        self._done = False
+
+    def push(self, model: BaseModel):
+        with self._lock:
+            self._latest = model
+
+    def close(self):
+        with self._lock:
+            self._done = True
+
+    def pop(self) -> Tuple[Optional[BaseModel], bool]:
+        with self._lock:
+            model, self._latest = self._latest, None
+            return model, self._done
 
 
 class PydanticModelEditorCard(PydanticModelEditor):
@@ -403,6 +1055,12 @@ class BaseCollectionEditor(CompositeWidget):
 
     expand = param.Boolean(True)
 
+    compact = param.Boolean(
+        default=False,
+        doc="""Render the item widgets without a wrapping row or card and
+        remove button each, items are removed with one shared control.""",
+    )
+
     class_ = param.ClassSelector(class_=object, is_instance=False)
 
     item_field = param.ClassSelector(class_=FieldInfo, default=None, allow_None=True)
@@ -414,11 +1072,40 @@ class BaseCollectionEditor(CompositeWidget):
     __abstract = True
 
     def __init__(self, **params):
+        self._item_watchers = {}
+        # The panel of each item widget, reused while the widget is
+        self._panels = {}
+        self._torn_down = False
+        self._remove_select = None
         super().__init__(**params)
         self.param.watch(self._value_changed, "value")
         self.param.trigger("value")
 
+    def teardown(self):
+        """Unregisters the watchers of the item widgets and tears down
+        nested editors. Rendering the editor again sets them up anew.
+        """
+        for name, widget in self._widgets.items():
+            watcher = self._item_watchers.pop(name, None)
+            if watcher is not None:
+                widget.param.unwatch(watcher)
+            if hasattr(widget, "teardown"):
+                widget.teardown()
+        self._composite[:] = []
+        self._panels = {}
+        self._torn_down = True
+
+    def _get_model(self, doc, root=None, parent=None, comm=None):
+        if self._torn_down:
+            self._torn_down = False
+            self._create_widgets()
+            self._update_panels()
+        return super()._get_model(doc, root, parent, comm)
+
     def _panel_for(self, name, widget):
+        if self.compact:
+            return widget
+
         if isinstance(widget, CompositeWidget):
             panel = Card(widget, header=str(name), collapsed=not self.expand)
         else:
@@ -435,22 +1122,44 @@ class BaseCollectionEditor(CompositeWidget):
             panel.append(remove_button)
         return panel
 
+    def _cached_panel(self, name, widget):
+        cached = self._panels.get(name, None)
+        if cached is None or cached[0] is not widget:
+            cached = self._panels[name] = (widget, self._panel_for(name, widget))
+        return cached[1]
+
+    def _add_widget(self, name, item):
+        widget = self._widget_for(name, item)
+
+        def cb(event):
+            self.sync_item(name)
+
+        self._item_watchers[name] = widget.param.watch(cb, "value")
+        self._widgets[name] = widget
+        return widget
+
     def _create_widgets(self, *events, reset=True):
         if reset:
             self._widgets = {}
-        for name, item in self.items():
-            widget = self._widget_for(name, item)
-
-            def cb(event):
-                self.sync_item(name)
-
-            widget.param.watch(cb, "value")
-            self._widgets[name] = widget
+            self._item_watchers = {}
+        for name, item in self.visible_items():
+            self._add_widget(name, item)
 
     def _update_panels(self, *events):
-        panels = [
-            self._panel_for(name, widget) for name, widget in self._widgets.items()
-        ]
+        if self.compact:
+            self._composite[:] = [
+                *self._widgets.values(),
+                *self._compact_controls(),
+            ]
+            return
+
+        panels = [self._cached_panel(name, widget) for name, widget in self._widgets.items()]
+        self._panels = {
+            name: self._panels[name] for name in self._widgets if name in self._panels
+        }
+        navigation = self._navigation()
+        if navigation is not None:
+            panels.insert(0, navigation)
         if self.name:
             panels.insert(0, pn.panel(f"### {self.name.capitalize()}"))
         panels.append(pn.panel(self._controls))
@@ -459,7 +1168,7 @@ class BaseCollectionEditor(CompositeWidget):
         self._composite[:] = panels
 
     def _sync_widgets(self, *events):
-        for name, item in self.items():
+        for name, item in self.visible_items():
             widget = self._widgets.get(name, None)
             if widget is None:
                 continue
@@ -471,15 +1180,44 @@ class BaseCollectionEditor(CompositeWidget):
             self._widgets = {}
             self._update_panels()
             return
-        if set(self._widgets).symmetric_difference(self.keys()):
+        visible = [name for name, _ in self.visible_items()]
+        if set(self._widgets).symmetric_difference(visible):
             self._create_widgets()
             self._update_panels()
         else:
             self._sync_widgets()
 
+    def _compact_controls(self) -> list:
+        controls = []
+        navigation = self._navigation()
+        if navigation is not None:
+            controls.insert(0, navigation)
+        if self.allow_remove and self._widgets:
+            if self._remove_select is None:
+                self._remove_select = pn.widgets.Select(width=150)
+                remove_button = Button(name="❌", width=50, width_policy="auto")
+                remove_button.on_click(self._remove_selected)
+                self._remove_row = pn.Row(self._remove_select, remove_button)
+            self._remove_select.options = {str(k): k for k in self._widgets}
+            controls.append(self._remove_row)
+        if self.allow_add:
+            controls.append(self._controls())
+        return controls
+
+    def _remove_selected(self, event):
+        if self._remove_select.value is not None:
+            self.remove_item(self._remove_select.value)
+
     def _controls(self):
         return pn.Column()
 
+    def _navigation(self):
+        return None
+
+    def visible_items(self) -> list[Tuple[str, Any]]:
+        """The items that currently have a widget displayed."""
+        return self.items()
+
     def keys(self):
         raise NotImplementedError
 
@@ -519,21 +1257,17 @@ class ItemListEditor(BaseCollectionEditor):
         return list(enumerate(self.value))
 
     def add_item(self, item, name=None):
-        if name is None:
-            name = len(self.value)
-        idx = int(name)
-        self.value.insert(idx, item)
+        ListState(self.value).add(item, name)
         self.param.trigger("value")
         self.item_added = True
 
     def remove_item(self, name):
-        self.value.pop(int(name))
+        ListState(self.value).remove(name)
         self.param.trigger("value")
         self.item_removed = True
 
     def sync_item(self, name):
-        idx = int(name)
-        self.value[idx] = self._widgets[idx].value
+        ListState(self.value).set(name, self._widgets[int(name)].value)
         self.param.trigger("value")
 
     def _add_new_cb(self, event):
@@ -588,6 +1322,168 @@ class ItemDictEditor(BaseCollectionEditor):
 
     default_key = param.Parameter(default="")
 
+    search = param.String(default="", doc="Only display keys containing this string.")
+
+    page_size = param.Integer(default=None, allow_None=True, bounds=(1, None))
+
+    page = param.Integer(default=0, bounds=(0, None))
+
+    incremental = param.Boolean(
+        default=False,
+        doc="""Apply per-key changes in place and announce them on
+        `changed_key` instead of triggering `value`.""",
+    )
+
+    changed_key = param.Parameter(default=None)
+
+    item_renamed = param.Event()
+
+    def __init__(self, **params):
+        self._search_input = None
+        self._page_navigation = None
+        # Number of keys matching the search, None until counted
+        self._match_count = None
+        super().__init__(**params)
+        self.param.watch(self._view_changed, ["search", "page", "page_size"])
+
+    def _value_changed(self, *events):
+        self._match_count = None
+        super()._value_changed(*events)
+
+    def _view_changed(self, *events):
+        if any(e.name == "search" for e in events):
+            self._match_count = None
+            if self.page:
+                self.page = 0
+                return
+        self._refresh_view()
+
+    def _refresh_view(self):
+        visible = dict(self.visible_items())
+        if list(visible) == list(self._widgets):
+            return
+        widgets = {name: w for name, w in self._widgets.items() if name in visible}
+        for name in set(self._widgets) - set(widgets):
+            self._item_watchers.pop(name, None)
+        self._widgets = widgets
+        for name, item in visible.items():
+            if name not in widgets:
+                self._add_widget(name, item)
+        self._widgets = {name: self._widgets[name] for name in visible}
+        self._update_panels()
+
+    def _matches(self, key) -> bool:
+        return not self.search or self.search.lower() in str(key).lower()
+
+    def _update_view(self, removed=(), added=()):
+        """Applies keys removed from and added to the end of the dict
+        to the displayed items. Only the panels of the items entering
+        or leaving the view are created or removed.
+        """
+        if self._match_count is not None:
+            self._match_count += sum(1 for key in added if self._matches(key))
+            self._match_count -= sum(1 for key in removed if self._matches(key))
+
+        if self.page_size:
+            if self.page >= self.page_count():
+                # The last page was emptied, showing the new last page
+                # goes through _view_changed
+                self.page = self.page_count() - 1
+                return
+            visible = [name for name, _ in self.visible_items()]
+        else:
+            visible = [name for name in self._widgets if name not in removed]
+            visible += [name for name in added if self._matches(name)]
+
+        if self.compact:
+            self._refresh_view()
+            return
+
+        # Removed keys are dropped even if re-added, they move to the end
+        shown = set(visible).difference(removed)
+        for name in [name for name in self._widgets if name not in shown]:
+            self._remove_panel(name)
+        for name in visible:
+            if name not in self._widgets:
+                self._append_panel(name, self.value[name])
+        self._update_navigation()
+
+    def _remove_panel(self, name):
+        widget = self._widgets.pop(name)
+        watcher = self._item_watchers.pop(name, None)
+        if watcher is not None:
+            widget.param.unwatch(watcher)
+        _, panel = self._panels.pop(name, (None, None))
+        if panel is not None:
+            self._composite.remove(panel)
+
+    def _append_panel(self, name, item):
+        objects = self._composite.objects
+        if self._panels:
+            _, last = list(self._panels.values())[-1]
+            index = objects.index(last) + 1
+        else:
+            # Before the add controls and the divider
+            index = len(objects) - 2
+        widget = self._add_widget(name, item)
+        self._composite.insert(index, self._cached_panel(name, widget))
+
+    def _notify(self, name):
+        with param.parameterized.discard_events(self):
+            self.changed_key = name
+        self.param.trigger("changed_key")
+
+    def _matching_keys(self):
+        if not self.search:
+            return iter(self.value)
+        needle = self.search.lower()
+        return (key for key in self.value if needle in str(key).lower())
+
+    def visible_items(self) -> list[tuple[str, Any]]:
+        keys = self._matching_keys()
+        if self.page_size:
+            start = self.page * self.page_size
+            keys = itertools.islice(keys, start, start + self.page_size)
+        return [(key, self.value[key]) for key in keys]
+
+    def page_count(self) -> int:
+        if not self.page_size:
+            return 1
+        if self._match_count is None:
+            self._match_count = sum(1 for _ in self._matching_keys())
+        return max(1, -(-self._match_count // self.page_size))
+
+    def _navigation(self):
+        if not self.page_size:
+            return None
+
+        if self._page_navigation is None:
+            self._search_input = pn.widgets.TextInput.from_param(
+                self.param.search, name="", placeholder="Search keys"
+            )
+
+            def previous_page(event):
+                self.page = max(self.page - 1, 0)
+
+            def next_page(event):
+                self.page = min(self.page + 1, self.page_count() - 1)
+
+            previous_button = Button(name="◀", width=50, width_policy="auto")
+            previous_button.on_click(previous_page)
+            next_button = Button(name="▶", width=50, width_policy="auto")
+            next_button.on_click(next_page)
+            self._page_label = pn.pane.Markdown()
+            self._page_navigation = pn.Row(
+                self._search_input, previous_button, self._page_label, next_button
+            )
+
+        self._update_navigation()
+        return self._page_navigation
+
+    def _update_navigation(self):
+        if self._page_navigation is not None:
+            self._page_label.object = f"{self.page + 1} / {self.page_count()}"
+
     def keys(self):
         return list(self.value)
 
@@ -597,21 +1493,54 @@ class ItemDictEditor(BaseCollectionEditor):
     def items(self) -> list[tuple[str, Any]]:
         return list(self.value.items())
 
+    def _collection(self) -> DictState:
+        return DictState(self.value, default_key=self.default_key)
+
     def add_item(self, item, name=None):
-        if name is None:
-            name = self.default_key
-        self.value[name] = item
-        self.param.trigger("value")
+        new = (self.default_key if name is None else name) not in self.value
+        name = self._collection().add(item, name)
+        if self.incremental:
+            widget = self._widgets.get(name, None)
+            if new:
+                self._update_view(added=[name])
+            elif widget is not None:
+                with param.parameterized.discard_events(widget):
+                    widget.value = item
+            self._notify(name)
+        else:
+            self.param.trigger("value")
         self.item_added = True
 
     def remove_item(self, name):
-        self.value.pop(name, None)
-        self.param.trigger("value")
+        removed = name in self.value
+        self._collection().remove(name)
+        if self.incremental:
+            if removed:
+                self._update_view(removed=[name])
+            self._notify(name)
+        else:
+            self.param.trigger("value")
         self.item_removed = True
 
+    def rename_item(self, name, new_name):
+        """Moves the item stored under `name` to `new_name`.
+        The renamed item is moved to the end of the dict.
+        """
+        replaced = [new_name] if new_name != name and new_name in self.value else []
+        self._collection().rename(name, new_name)
+        if self.incremental:
+            self._update_view(removed=[name, *replaced], added=[new_name])
+            self._notify(new_name)
+        else:
+            self.param.trigger("value")
+        self.item_renamed = True
+
     def sync_item(self, name):
-        self.value[name] = self._widgets[name].value
-        self.param.trigger("value")
+        self._collection().set(name, self._widgets[name].value)
+        if self.incremental:
+            self._notify(name)
+        else:
+            self.param.trigger("value")
 
     def _widget_for(self, name, item):
         if item is None:
@@ -656,6 +1585,9 @@ def infer_widget(value: BaseModel, field: Optional[FieldInfo] = None, **kwargs):
         class_ = kwargs.pop("class_", type(value))
         return PydanticModelEditor(value=value, class_=class_, **kwargs)
 
+    if union_variants(field.annotation):
+        return infer_union_widget(value, field, **kwargs)
+
     class_ = kwargs.pop("class_", field.annotation)
     kwargs = clean_kwargs(PydanticModelEditorCard, kwargs)
     return PydanticModelEditorCard(value=value, class_=class_, **kwargs)
@@ -665,12 +1597,22 @@ def infer_widget(value: BaseModel, field: Optional[FieldInfo] = None, **kwargs):
 def infer_widget(value: list[BaseModel], field: Optional[FieldInfo] = None, **kwargs):
 
     if field is not None:
-        kwargs["class_"] = kwargs.pop("class_", field.annotation)
+        # Collection editors take the class of the items
+        kwargs["class_"] = kwargs.pop("class_", get_args(field.annotation)[0])
         if value is None:
             value = field.default
 
     if value is None:
         value = []
+
+    if kwargs.pop("tabular", field_hint(field, "tabular", False)):
+        from .tables import ItemTableEditor
+
+        if field is not None:
+            kwargs["item_field"] = kwargs.pop("item_field", field)
+        kwargs = clean_kwargs(ItemTableEditor, kwargs)
+        return ItemTableEditor(value=value, **kwargs)
+
     kwargs = clean_kwargs(ItemListEditor, kwargs)
     return ItemListEditor(value=value, **kwargs)
 
@@ -681,7 +1623,7 @@ def infer_widget(
 ):
 
     if field is not None:
-        kwargs["class_"] = kwargs.pop("class_", field.annotation)
+        kwargs["class_"] = kwargs.pop("class_", get_args(field.annotation)[-1])
         if value is None:
             value = field.default
 
@@ -2,10 +2,26 @@
 """Tests for `pydantic_panel` package."""
 # pylint: disable=redefined-outer-name
 
+import asyncio
+import gc
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+
+from types import SimpleNamespace
+
 import pydantic_panel
 import pytest
 import panel as pn
-from pydantic import BaseModel
+from bokeh.document import Document
+from bokeh.models.css import StyleSheet
+from typing import Annotated, List, Literal, Union
+
+import pydantic
+
+from pydantic import BaseModel, Field
 
 
 class SomeModel(BaseModel):
@@ -49,3 +65,1016 @@ def test_bidirectional():
         setattr(m, k, v)
         assert w._widgets[k].value == v
     assert w.value == m
+
+
+def test_item_table_editor():
+    from panel.models.tabulator import TableEditEvent
+
+    items = [SomeModel(regular_int=i) for i in range(3)]
+    w = pydantic_panel.infer_widget(items, tabular=True)
+    assert isinstance(w, pydantic_panel.ItemTableEditor)
+    assert list(w._table.value.columns) == list(SomeModel.model_fields)
+
+    w._validate_cell(TableEditEvent(None, "regular_int", 1, value=7, old=1))
+    assert w.value[1].regular_int == 7
+    assert w.value[0] is items[0]
+
+    w._validate_cell(TableEditEvent(None, "regular_int", 2, value="x", old=2))
+    assert w.value[2].regular_int == 2
+    assert w.errors[(2, "regular_int")][0]["type"] == "int_parsing"
+
+
+class Inventory(BaseModel):
+    items: Annotated[List[SomeModel], pydantic_panel.Hint(tabular=True)] = []
+    others: List[SomeModel] = []
+
+
+def test_item_table_editor_field():
+    w = pn.panel(Inventory())
+    table = w._widgets["items"]
+    assert isinstance(table, pydantic_panel.ItemTableEditor)
+    assert table.class_ is SomeModel
+    assert not isinstance(w._widgets["others"], pydantic_panel.ItemTableEditor)
+
+    w.value = Inventory(items=[SomeModel(regular_int=3)])
+    assert list(w._widgets["items"]._table.value["regular_int"]) == [3]
+
+
+def test_item_dict_editor_paged_incremental():
+    data = {f"key{i}": SomeModel(regular_int=i) for i in range(50)}
+    w = pydantic_panel.ItemDictEditor(
+        value=data, class_=SomeModel, page_size=10, incremental=True
+    )
+    assert list(w._widgets) == [f"key{i}" for i in range(10)]
+
+    w.page = 4
+    assert list(w._widgets) == [f"key{i}" for i in range(40, 50)]
+
+    w.search = "key1"
+    assert w.page == 0
+    assert set(w._widgets) == {"key1"} | {f"key1{i}" for i in range(9)}
+
+    value_events, changed = [], []
+    w.param.watch(value_events.append, "value")
+    w.param.watch(lambda e: changed.append(e.new), "changed_key")
+
+    w.add_item(SomeModel(), "key100")
+    w.rename_item("key3", "key13")
+    w.remove_item("key10")
+    assert changed == ["key100", "key13", "key10"]
+    assert not value_events
+    assert "key10" not in w.value and "key13" in w.value
+    assert "key10" not in w._widgets
+
+
+def test_item_dict_editor_incremental_panels():
+    data = {f"key{i}": SomeModel(regular_int=i) for i in range(200)}
+    w = pydantic_panel.ItemDictEditor(value=data, class_=SomeModel, incremental=True)
+    panels = list(w._composite.objects)
+
+    start = time.perf_counter()
+    w.add_item(SomeModel(), "key200")
+    w.remove_item("key0")
+    w.rename_item("key1", "first")
+    print(f"\nAdded, removed and renamed 1 of 200 keys in {time.perf_counter() - start:.4f}s")
+
+    objects = w._composite.objects
+    # Only the panels of the changed keys were replaced
+    assert objects[:-4] == panels[2:-2]
+    assert [p.objects[0].name for p in objects[-4:-2]] == ["key200", "first"]
+    assert list(w._widgets)[-2:] == ["key200", "first"]
+
+    data = {f"key{i}": SomeModel(regular_int=i) for i in range(1000)}
+    paged = pydantic_panel.ItemDictEditor(
+        value=data, class_=SomeModel, page_size=10, incremental=True
+    )
+    navigation = paged._navigation()
+    paged.add_item(SomeModel(), "extra")
+    assert paged._navigation() is navigation
+    assert paged._page_label.object == "1 / 101"
+    paged.page = 100
+    assert list(paged._widgets) == ["extra"]
+    paged.remove_item("extra")
+    assert paged.page == 99 and paged._page_label.object == "100 / 100"
+
+
+@pytest.mark.parametrize("filename", ["model.json", "models.db"])
+def test_autosave(tmp_path, filename):
+    path = tmp_path / filename
+    w = pydantic_panel.PydanticModelEditor(
+        class_=SomeModel, value=SomeModel(), autosave=str(path), autosave_interval=60
+    )
+    for i in range(100):
+        w._widgets["regular_int"].value = i
+    w._autosaver.flush()
+    # The edits were coalesced, the first one may or may not be saved alone
+    assert 1 <= w._autosaver.writes <= 2
+
+    restored = pydantic_panel.PydanticModelEditor(class_=SomeModel, autosave=str(path))
+    assert restored.value.regular_int == 99
+    assert restored._widgets["regular_int"].value == 99
+
+
+@pytest.mark.parametrize("data", ["{not json", '{"regular_int": "old schema"}'])
+def test_autosave_unreadable(tmp_path, data, caplog):
+    path = tmp_path / "model.json"
+    path.write_text(data)
+    w = pydantic_panel.PydanticModelEditor(
+        class_=SomeModel, value=SomeModel(regular_int=1), autosave=str(path)
+    )
+    assert w.value.regular_int == 1
+    assert "could not be restored" in caplog.text
+
+
+def test_teardown_and_restore():
+    m = SomeModel()
+    w = pn.panel(m, bidirectional=True)
+    w.teardown()
+    m.regular_int = 1
+    assert w._widgets["regular_int"].value == 42
+
+    w.get_root(Document())
+    m.regular_int = 2
+    assert w._widgets["regular_int"].value == 2
+
+
+def _open_and_close_session(model):
+    pane = pydantic_panel.Pydantic(model, bidirectional=True)
+    doc = Document()
+    pane.server_doc(doc)
+
+    # Mimic what the bokeh server does when a session is destroyed
+    session_context = SimpleNamespace(_document=doc, id=None)
+    for cb in list(doc.session_destroyed_callbacks):
+        cb(session_context)
+
+    def session(event):
+        pass
+
+    doc.on_change(session)
+    doc.destroy(session)
+    return weakref.ref(pane.widget)
+
+
+def test_session_memory_is_bounded():
+    # Set PYDANTIC_PANEL_BENCH_SESSIONS=1000 for the full benchmark
+    sessions = int(os.environ.get("PYDANTIC_PANEL_BENCH_SESSIONS", 20))
+    shared = SomeModel()
+    _open_and_close_session(shared)
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        editors = [_open_and_close_session(shared) for _ in range(sessions)]
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert not [ref for ref in editors if ref() is not None]
+    assert not pydantic_panel.widgets._model_syncs[id(shared)].callbacks
+    assert growth < 1_000_000 + 10_000 * sessions
+
+
+def _model_count(*roots):
+    return len(
+        {
+            model.id
+            for root in roots
+            for model in root.references()
+            if not isinstance(model, StyleSheet)
+        }
+    )
+
+
+@pytest.mark.parametrize("views", [1, 2, 10])
+def test_views_share_models(views):
+    pane = pydantic_panel.Pydantic(SomeModel())
+    doc = Document()
+
+    start = time.perf_counter()
+    roots = [pn.Column(pane).get_root(doc) for _ in range(views)]
+    elapsed = time.perf_counter() - start
+
+    single = _model_count(pn.Column(pydantic_panel.Pydantic(SomeModel())).get_root())
+    # Each extra view only adds its own Column model
+    assert _model_count(*roots) == single + views - 1
+    print(f"{views} views: {_model_count(*roots)} models in {elapsed:.3f}s")
+
+    for root in roots[:-1]:
+        pane._cleanup(root)
+    assert pane.widget._widgets["regular_int"]._models
+    pane._cleanup(roots[-1])
+    assert not pane.widget._widgets["regular_int"]._models
+
+
+class ConstrainedModel(BaseModel):
+    positive: int = Field(1, ge=0)
+
+
+def test_validation_errors_are_published():
+    w = pn.panel(ConstrainedModel())
+    events = []
+    w.param.watch(events.append, "value")
+
+    w._widgets["positive"].value = -1
+    assert w.value.positive == 1
+    assert w._widgets["positive"].value == -1
+    assert w.errors["positive"][0]["type"] == "greater_than_equal"
+    assert not w.valid
+    assert not events
+
+    w._widgets["positive"].value = 5
+    assert w.value.positive == 5
+    assert w.valid
+
+
+def test_stream():
+    w = pn.panel(SomeModel())
+    values = []
+    w.param.watch(values.append, "value")
+    string_updates = []
+    w._widgets["regular_string"].param.watch(string_updates.append, "value")
+
+    async def source():
+        for i in range(100):
+            yield SomeModel(regular_int=i)
+
+    async def main():
+        callback = w.stream(source(), interval=0.01)
+        while callback.running:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    assert w.value.regular_int == 99
+    assert w._widgets["regular_int"].value == 99
+    assert 0 < len(values) < 100
+    assert not string_updates
+
+
+class ParentModel(BaseModel):
+    title: str = "<parent>"
+    child: SomeModel = SomeModel()
+
+
+def test_readonly():
+    pane = pydantic_panel.Pydantic(ParentModel(), readonly=True)
+    root = pane.get_root(Document())
+    assert _model_count(root) == 1
+    assert "&lt;parent&gt;" in pane.widget.html
+    assert "<details><summary>SomeModel</summary>" in pane.widget.html
+
+    pane.object = ParentModel(title="updated")
+    assert "updated" in root.text
+    assert pane.get_root(Document()) is not root
+
+    # pn.panel unpacks the pane, the view it returns stays reactive
+    model = ParentModel()
+    view = pn.panel(model, readonly=True)
+    assert isinstance(view, pydantic_panel.ReadOnlyView)
+    root = view.get_root(Document())
+    model.title = "mutated"
+    view.refresh()
+    assert "mutated" in root.text
+    view.object = ParentModel(title="replaced")
+    assert "replaced" in root.text
+
+
+def test_constraints_reach_widgets():
+    class Bounded(BaseModel):
+        count: int = Field(2, gt=0, lt=10, multiple_of=2)
+        ratio: float = Field(0.5, gt=0, le=1, multiple_of=0.25)
+        label: str = Field("a", max_length=5)
+        odd: int = Field(3, ge=1, le=12, multiple_of=3)
+        level: int = Field(1, gt=0, lt=5)
+
+    w = pn.panel(Bounded())
+    count, ratio, label = (w._widgets[k] for k in ("count", "ratio", "label"))
+    # Bounds are rounded inwards to valid multiples of the step
+    assert (count.start, count.end, count.step) == (2, 8, 2)
+    assert (ratio.start, ratio.end, ratio.step) == (0.25, 1, 0.25)
+    odd, level = w._widgets["odd"], w._widgets["level"]
+    assert (odd.start, odd.end, odd.step) == (3, 12, 3)
+    assert (level.start, level.end) == (1, 4)
+    assert label.max_length == 5
+
+
+def test_concurrent_edits():
+    class ManyFields(BaseModel):
+        f0: int = 0
+        f1: int = 0
+        f2: int = 0
+        f3: int = 0
+        f4: int = 0
+        f5: int = 0
+        f6: int = 0
+        f7: int = 0
+
+    m = ManyFields()
+    w = pn.panel(m, bidirectional=True)
+    edits = 200
+
+    def edit_widget(name):
+        for i in range(1, edits + 1):
+            w._widgets[name].value = i
+
+    def edit_model(name):
+        for i in range(1, edits + 1):
+            setattr(m, name, i)
+
+    threads = [
+        threading.Thread(target=edit_widget if i % 2 else edit_model, args=(f"f{i}",))
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name in ManyFields.model_fields:
+        assert getattr(m, name) == edits
+        assert w._widgets[name].value == edits
+
+
+def test_bidirectional_coalescing():
+    m = SomeModel()
+    w = pn.panel(m, bidirectional=True, bidirectional_interval=60)
+    updates = []
+    w._widgets["regular_int"].param.watch(updates.append, "value")
+
+    for i in range(1000):
+        m.regular_int = i
+        m.regular_string = str(i)
+    assert not updates
+
+    w._flush_widget_updates()
+    assert len(updates) == 1
+    assert w._widgets["regular_int"].value == 999
+    assert w._widgets["regular_string"].value == "999"
+
+    # In a served session the flush runs as a callback of the document
+    w._document = doc = _QueuedDocument()
+    m.regular_int = 5
+    m.regular_int = 6
+    assert w._flush_timer is None and len(doc.callbacks) == 1
+    doc.run()
+    assert w._widgets["regular_int"].value == 999
+    doc.run()
+    assert w._widgets["regular_int"].value == 6 and len(updates) == 2
+
+
+def test_large_text():
+    class Document_(BaseModel):
+        body: str = ""
+        notes: Annotated[str, pydantic_panel.Hint(large_text=True)] = ""
+
+    body = "line\n" * 100_000
+    w = pn.panel(Document_(body=body))
+    editor = w._widgets["body"]
+    assert isinstance(editor, pydantic_panel.LargeTextEditor)
+    assert not editor.select(pn.widgets.TextAreaInput)
+    assert len(editor._preview.object) < 1000
+
+    editor._start_editing()
+    assert editor._text_area.value == body
+    editor._text_area.value = "edited"
+    assert w.value.body == body
+
+    editor._save()
+    assert w.value.body == "edited"
+    assert editor._text_area is None
+    # Short values use the large text editor when the field asks for it
+    assert isinstance(w._widgets["notes"], pydantic_panel.LargeTextEditor)
+    assert "large_text" not in str(Document_.model_json_schema())
+
+
+def _upload(dropper, name, payload_chunk, total_chunks, mime="application/octet-stream"):
+    for chunk in range(1, total_chunks + 1):
+        data = dict(
+            name=name, chunk=chunk, total_chunks=total_chunks,
+            data=payload_chunk, type=mime,
+        )
+        dropper._process_event(SimpleNamespace(event_name="upload_event", data=data))
+
+
+def test_file_upload(tmp_path):
+    from pathlib import Path
+
+    class Attachment(BaseModel):
+        content: bytes = b""
+        archive: Path = Path("missing.bin")
+
+    w = pn.panel(Attachment())
+    content = w._widgets["content"]
+    archive = w._widgets["archive"]
+    assert isinstance(content, pydantic_panel.FileUploadEditor)
+    assert isinstance(archive, pydantic_panel.FileUploadEditor)
+
+    _upload(content._dropper, "small.txt", b"abc", 2, mime="text/plain")
+    assert w.value.content == b"abcabc"
+
+    # Memory benchmark, uploads are written to disk chunk by chunk.
+    # Set PYDANTIC_PANEL_BENCH_UPLOAD_MB=100 for the full benchmark
+    size_mb = int(os.environ.get("PYDANTIC_PANEL_BENCH_UPLOAD_MB", 4))
+    archive._dropper.directory = str(tmp_path)
+    chunk = os.urandom(1024 * 1024)
+    tracemalloc.start()
+    try:
+        _upload(archive._dropper, "../big.bin", chunk, size_mb)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert w.value.archive == tmp_path / "big.bin"
+    assert w.value.archive.stat().st_size == size_mb * len(chunk)
+    assert peak < 2 * len(chunk)
+
+    # Removing the upload deletes the file, the field goes back to its default
+    path = w.value.archive
+    delete = SimpleNamespace(event_name="delete_event", data=dict(name="../big.bin"))
+    archive._dropper._process_event(delete)
+    assert not path.exists()
+    assert w.value.archive == Path("missing.bin")
+
+
+class FormModel(BaseModel):
+    count: int = Field(0, ge=0)
+    label: str = Field("", max_length=10)
+
+
+def test_form_state_matches_editor():
+    submissions = [
+        {"count": 5, "label": "ok"},
+        {"count": -1},
+        {"label": "x" * 100},
+        {"count": 7},
+    ]
+
+    editor = pydantic_panel.PydanticModelEditor(class_=FormModel, value=FormModel())
+    state = pydantic_panel.FormState(FormModel, FormModel())
+    for data in submissions:
+        for name, value in data.items():
+            editor._widgets[name].value = value
+        state.submit(data)
+        assert state.value == editor.value
+        assert state.errors == editor.errors
+
+    items = pydantic_panel.ListState()
+    items.add("b")
+    items.add("a", 0)
+    items.set(1, "c")
+    assert items.value == ["a", "c"]
+    mapping = pydantic_panel.DictState(default_key="new")
+    mapping.add(1)
+    mapping.rename("new", "old")
+    assert mapping.value == {"old": 1}
+
+
+def test_form_state_sessions_benchmark():
+    sessions = int(os.environ.get("PYDANTIC_PANEL_BENCH_FORMS", 2000))
+    start = time.perf_counter()
+    valid = 0
+    for i in range(sessions):
+        state = pydantic_panel.FormState(FormModel, FormModel())
+        state.submit({"count": i % 20 - 5, "label": "session"})
+        valid += state.valid
+    elapsed = time.perf_counter() - start
+    print(f"\n{sessions} headless form sessions in {elapsed:.3f}s")
+    assert valid == sum(1 for i in range(sessions) if i % 20 - 5 >= 0)
+
+
+class Circle(BaseModel):
+    kind: Literal["circle"] = "circle"
+    radius: float = 1.0
+
+
+class Square(BaseModel):
+    kind: Literal["square"] = "square"
+    side: float = 1.0
+
+
+class Triangle(BaseModel):
+    kind: Literal["triangle"] = "triangle"
+    base: float = 1.0
+
+
+class Drawing(BaseModel):
+    shape: Union[Circle, Square, Triangle] = Field(Circle(), discriminator="kind")
+    size: Union[int, str] = 3
+
+
+def test_union_editor_builds_active_variant_only():
+    w = pn.panel(Drawing())
+    editor = w._widgets["shape"]
+    assert isinstance(editor, pydantic_panel.UnionEditor)
+    assert list(editor._selector.options) == ["circle", "square", "triangle"]
+    assert list(editor._editors) == [Circle]
+
+    editor.cache_size = 1
+    editor._selector.value = Square
+    assert isinstance(w.value.shape, Square)
+    editor.editor._widgets["side"].value = 2.5
+    assert w.value.shape.side == 2.5
+
+    editor._selector.value = Triangle
+    assert list(editor._editors) == [Square, Triangle]
+    editor._selector.value = Square
+    assert w.value.shape.side == 2.5
+
+    w.value = Drawing(shape=Circle(radius=4), size="big")
+    assert editor.active is Circle
+    assert editor.editor.value.radius == 4
+    size = w._widgets["size"]
+    assert size.active is str
+    assert size.editor.value == "big"
+
+
+class _QueuedDocument:
+    """Stands in for the document of a served session."""
+
+    session_context = True
+
+    def __init__(self):
+        self.callbacks = []
+
+    def add_next_tick_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def add_timeout_callback(self, callback, timeout):
+        self.callbacks.append(callback)
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def test_shared_model_fan_out():
+    sessions = int(os.environ.get("PYDANTIC_PANEL_BENCH_SHARED_SESSIONS", 150))
+    shared = pydantic_panel.SharedModel(FormModel())
+    docs, editors = [], []
+    for _ in range(sessions):
+        editor = pydantic_panel.PydanticModelEditor(shared=shared)
+        doc = _QueuedDocument()
+        shared.attach(editor, doc)
+        docs.append(doc)
+        editors.append(editor)
+
+    start = time.perf_counter()
+    editors[0]._widgets["count"].value = 5
+    for doc in docs:
+        doc.run()
+    elapsed = time.perf_counter() - start
+    print(f"\nOne edit sent to {sessions} sessions in {elapsed:.3f}s")
+
+    assert shared.validations == 1
+    assert shared.value.count == 5
+    assert all(e._widgets["count"].value == 5 for e in editors)
+    assert all(e.value is shared.value for e in editors)
+
+    editors[1]._widgets["count"].value = -1
+    assert shared.validations == 2
+    assert "count" in editors[1].errors
+    assert shared.value.count == 5
+
+
+def test_shared_model_conflicts():
+    shared = pydantic_panel.SharedModel(FormModel(), conflict="reject")
+    a = pydantic_panel.PydanticModelEditor(shared=shared)
+    b = pydantic_panel.PydanticModelEditor(shared=shared)
+    doc_a, doc_b = _QueuedDocument(), _QueuedDocument()
+    shared.attach(a, doc_a)
+    shared.attach(b, doc_b)
+
+    a._widgets["count"].value = 5
+    # b edits before the change of a reached it
+    b._widgets["count"].value = 7
+    assert shared.value.count == 5
+    assert shared.conflicts == 1
+    assert b.errors["count"][0]["type"] == "conflict"
+    assert b._widgets["count"].value == 5
+
+    doc_b.run()
+    b._widgets["count"].value = 8
+    assert shared.value.count == 8
+    assert not b.errors
+    doc_a.run()
+    assert a._widgets["count"].value == 8
+
+
+class Measurements(BaseModel):
+    samples: list[float] = []
+    labels: dict[str, int] = {}
+    point: tuple[int, str] = (0, "origin")
+
+
+def test_scalar_collection_editors():
+    w = pn.panel(Measurements(samples=[float(i) for i in range(5000)], labels={"a": 1}))
+    samples = w._widgets["samples"]
+    assert isinstance(samples, pydantic_panel.ScalarListEditor)
+    assert samples._table.page_size == 50
+
+    edit = SimpleNamespace(row=4321, column="value", value="2.5", old=4321.0)
+    start = time.perf_counter()
+    samples._validate_cell(edit)
+    print(f"\nEdited 1 of 5000 elements in {time.perf_counter() - start:.4f}s")
+    assert w.value.samples[4321] == 2.5
+    assert len(w.value.samples) == 5000
+
+    samples._validate_cell(SimpleNamespace(row=3, column="value", value="x", old=3.0))
+    assert w.value.samples[3] == 3.0
+    assert 3 in samples.errors
+
+    labels = w._widgets["labels"]
+    assert isinstance(labels, pydantic_panel.ScalarDictEditor)
+    labels._validate_cell(SimpleNamespace(row=0, column="value", value=7, old=1))
+    labels._validate_cell(SimpleNamespace(row=0, column="key", value="b", old="a"))
+    assert w.value.labels == {"b": 7}
+    labels.add_item(name="c")
+    assert w.value.labels == {"b": 7, "c": 0}
+
+    point = w._widgets["point"]
+    assert isinstance(point, pydantic_panel.ScalarTupleEditor)
+    point._validate_cell(SimpleNamespace(row=0, column="value", value="12", old=0))
+    assert w.value.point == (12, "origin")
+    point._validate_cell(SimpleNamespace(row=0, column="value", value="x", old=12))
+    assert 0 in point.errors
+    assert w.value.point == (12, "origin")
+
+
+class Series(BaseModel):
+    values: list[float] = []
+    ordered: list[float] = []
+    pair: list[float] = Field([0.0, 1.0], max_length=2)
+    single: dict[str, float] = Field({}, max_length=1)
+    names: dict[str, float] = {}
+
+    @pydantic.field_validator("ordered")
+    @classmethod
+    def check_sorted(cls, values):
+        SERIES_VALIDATED.append(len(values))
+        if values != sorted(values):
+            raise ValueError("Values must be sorted.")
+        return values
+
+
+SERIES_VALIDATED = []
+
+
+def _edit_cell(editor, row, value, old=None):
+    editor._validate_cell(SimpleNamespace(row=row, column="value", value=value, old=old))
+
+
+def test_scalar_edit_field_validation():
+    w = pn.panel(
+        Series(values=[float(i) for i in range(5000)], ordered=[1, 2, 3], single={"a": 1})
+    )
+    stream = w.changes()
+
+    # Fields that only validate their elements are edited in place
+    values = w.value.values
+    _edit_cell(w._widgets["values"], 10, "2.5", 10.0)
+    _edit_cell(w._widgets["values"], 11, "x", 11.0)
+    assert w.value.values is values
+    assert values[10] == 2.5 and values[11] == 11.0
+    event = stream.get_nowait()
+    assert (event.path, event.old, event.new) == (("values", 10), 10.0, 2.5)
+
+    # Field validators and constraints still run
+    SERIES_VALIDATED.clear()
+    _edit_cell(w._widgets["ordered"], 0, 10.0, 1.0)
+    assert SERIES_VALIDATED == [3]
+    assert w.value.ordered == [1, 2, 3] and "ordered" in w.errors
+
+    w._widgets["single"].add_item(2.0)
+    _edit_cell(w._widgets["single"], 1, 5.0, 0.0)
+    assert w.value.single == {"a": 1} and "single" in w.errors
+
+    w._widgets["pair"].add_item(2.0)
+    _edit_cell(w._widgets["pair"], 2, 5.0, 2.0)
+    assert w.value.pair == [0, 1] and "pair" in w.errors
+
+    names = w._widgets["names"]
+    names.add_item(1.0)
+    names.add_item(2.0)
+    assert w.value.names == {"": 1.0, "1": 2.0}
+    with pytest.raises(ValueError):
+        names.add_item(3.0, name="1")
+
+
+def test_progressive_rendering():
+    fields = {f"field_{i}": (int, i) for i in range(25)}
+    fields["nested"] = (SomeModel, SomeModel())
+    LargeForm = pydantic.create_model("LargeForm", **fields)
+
+    pane = pydantic_panel.Pydantic(LargeForm(), progressive=True, batch_size=10)
+    editor = pane.widget
+    assert len(editor._widgets) == 10
+    assert "nested" in editor._unbuilt
+    assert len(editor._composite) == len(LargeForm.model_fields)
+
+    doc = Document()
+    doc._session_context = lambda: SimpleNamespace(id="session", request=None)
+    ticks = []
+    doc.add_next_tick_callback = ticks.append
+    pane.get_root(doc)
+
+    # Edits before all fields are built keep the model consistent
+    editor._widgets["field_0"].value = 100
+    editor.value = LargeForm(field_24=-24)
+
+    built = [len(editor._widgets)]
+    while ticks:
+        ticks.pop(0)()
+        built.append(len(editor._widgets))
+    assert sorted(set(built)) == [10, 20, 26]
+    assert not editor._placeholders
+    assert editor._widgets["field_24"].value == -24
+    assert editor._widgets["nested"].value == SomeModel()
+    assert list(editor._widgets) == list(LargeForm.model_fields)
+
+
+class Settings(BaseModel):
+    level: int = Field(5, ge=0, le=10)
+    enabled: bool = False
+    mode: Literal["fast", "slow"] = "fast"
+    ratio: float = Field(0.5, gt=0)
+
+
+class ValidatedSettings(Settings):
+    @pydantic.field_validator("level")
+    @classmethod
+    def check_level(cls, value):
+        return value
+
+
+def test_fast_validation_path():
+    checks = pydantic_panel.state.fast_field_checks(Settings)
+    assert set(checks) == {"level", "enabled", "mode", "ratio"}
+    assert "level" not in pydantic_panel.state.fast_field_checks(ValidatedSettings)
+
+    edits = int(os.environ.get("PYDANTIC_PANEL_BENCH_EDITS", 2000))
+    results = {}
+    for fast in (False, True):
+        w = pydantic_panel.PydanticModelEditor(
+            class_=Settings, value=Settings(), fast_validation=fast
+        )
+        level, enabled = w._widgets["level"], w._widgets["enabled"]
+        start = time.perf_counter()
+        for i in range(edits):
+            level.value = i % 11
+            enabled.value = bool(i % 2)
+        elapsed = time.perf_counter() - start
+        print(f"\nfast_validation={fast}: {2 * edits / elapsed:,.0f} edits/s")
+        results[fast] = (w.value, w._state.fast_assignments)
+
+    assert results[True][0] == results[False][0]
+    assert results[False][1] == 0
+    assert results[True][1] >= 2 * edits - 2
+
+    w = pn.panel(Settings())
+    w._widgets["level"].value = 11
+    assert "level" in w.errors
+    assert w.value.level == 5
+
+    state = pydantic_panel.FormState(Settings, Settings())
+    assert state.set_field("mode", "slow")
+    assert state.fast_assignments == 1
+    assert state.value.model_fields_set == {"mode"}
+    assert state.set_field("ratio", 1)
+    assert state.fast_assignments == 1
+    assert type(state.value.ratio) is float
+
+
+def _models_per_item(compact, make_item, class_):
+    counts = []
+    for n in (10, 30):
+        editor = pydantic_panel.ItemListEditor(
+            value=[make_item(i) for i in range(n)], class_=class_, compact=compact
+        )
+        counts.append(_model_count(editor.get_root(Document())))
+    return (counts[1] - counts[0]) / 20
+
+
+@pytest.mark.parametrize(
+    "make_item, class_", [(str, str), (lambda i: SomeModel(), SomeModel)]
+)
+def test_compact_collection_model_count(make_item, class_):
+    default = _models_per_item(False, make_item, class_)
+    compact = _models_per_item(True, make_item, class_)
+    print(f"\n{class_.__name__} items: {default} -> {compact} models per item")
+    assert compact < default
+    if class_ is str:
+        assert compact == 1
+
+    editor = pydantic_panel.ItemListEditor(
+        value=["a", "b", "c"], class_=str, compact=True
+    )
+    editor._remove_select.value = 1
+    editor._remove_selected(None)
+    assert editor.value == ["a", "c"]
+    assert list(editor._remove_select.options) == ["0", "1"]
+
+
+def test_record_traffic():
+    pane = pydantic_panel.Pydantic(SomeModel())
+    doc = Document()
+    doc.add_root(pane.get_root(doc))
+    editor = pane.widget
+
+    with pane.record_traffic("field edit") as edit:
+        editor._widgets["regular_int"].value = 7
+    with pane.record_traffic("value") as replace:
+        editor.value = SomeModel(**alt_data)
+    assert [r.operation for r in pane.traffic] == ["field edit", "value"]
+    assert edit.events == edit.models == 1
+    assert 0 < edit.bytes < 1000
+    assert replace.models == 3
+    assert replace.bytes > edit.bytes
+    assert "trigger_on_change" not in vars(doc.callbacks)
+
+    items = pydantic_panel.ItemListEditor(value=["a"], class_=str, compact=True)
+    editor = pydantic_panel.PydanticModelEditor(class_=SomeModel, value=SomeModel())
+    editor._composite.append(items)
+    doc = Document()
+    doc.add_root(editor.get_root(doc))
+    with editor.record_traffic("add") as add:
+        items.add_item("b")
+    assert add.models >= 1 and add.bytes > 0
+    # Budget for adding a scalar item to a compact list
+    assert add.bytes < 10_000
+
+
+def test_cli_serve():
+    from pydantic_panel import cli
+
+    assert cli.load_target("tests.test_pydantic_panel:SomeModel") is SomeModel
+    with pytest.raises(TypeError):
+        cli.load_target("tests.test_pydantic_panel:alt_data")
+    with pytest.raises(ValueError):
+        cli.load_target("tests.test_pydantic_panel")
+
+    times = cli.prewarm([SomeModel, Settings])
+    assert set(times) == {"SomeModel", "Settings"}
+
+    pane = cli.make_app(SomeModel)()
+    assert isinstance(pane, pydantic_panel.Pydantic)
+    assert pane.widget.value == SomeModel()
+
+    args = cli.make_parser().parse_args(
+        ["serve", "tests.test_pydantic_panel:SomeModel", "--port", "0", "--no-prewarm"]
+    )
+    assert args.num_procs == 1 and not args.prewarm
+    server = cli.serve(args, start=False)
+    try:
+        assert "/SomeModel" in server._tornado.applications
+    finally:
+        server.stop()
+
+
+VALIDATOR_CALLS = []
+
+
+class Quantity(BaseModel):
+    length: Annotated[str, pydantic_panel.Hint(pure=True)] = "1 m"
+    note: str = ""
+
+    @pydantic.field_validator("length", "note")
+    @classmethod
+    def parse(cls, value, info):
+        VALIDATOR_CALLS.append(info.field_name)
+        if info.field_name == "length" and not value.endswith(" m"):
+            raise ValueError("length must be in meters")
+        return value
+
+
+def test_validation_cache():
+    assert pydantic_panel.state.pure_fields(Quantity) == {"length"}
+    # Editor hints stay out of the JSON schema
+    assert "pure" not in str(Quantity.model_json_schema())
+
+    w = pydantic_panel.PydanticModelEditor(
+        class_=Quantity, value=Quantity(), validation_cache_size=3
+    )
+    length = w._widgets["length"]
+    VALIDATOR_CALLS.clear()
+    for value in ["2 m", "3 m", "2 m", "3 m", "2 m"]:
+        length.value = value
+    assert VALIDATOR_CALLS == ["length", "length"]
+    # The first miss is the initial value
+    assert w.validation_stats == dict(hits=3, misses=3, size=3)
+    assert w.value.length == "2 m"
+
+    length.value = "4 feet"
+    assert "length" in w.errors
+    length.value = "3 m"
+    length.value = "4 feet"
+    assert VALIDATOR_CALLS.count("length") == 3
+    assert w.validation_stats["hits"] == 5
+    assert "length" in w.errors and w.value.length == "3 m"
+
+    # Fields not declared pure are always validated
+    w._widgets["note"].value = "a"
+    w._widgets["note"].value = "b"
+    w._widgets["note"].value = "a"
+    assert VALIDATOR_CALLS.count("note") == 3
+
+
+def test_change_stream():
+    w = pydantic_panel.PydanticModelEditor(class_=Settings, value=Settings())
+    stream = w.changes(maxsize=2)
+    level = w._widgets["level"]
+    for value in (1, 2, 3):
+        level.value = value
+    level.value = 99
+    w._widgets["enabled"].value = True
+    w._widgets["mode"].value = "slow"
+
+    # Edits of the same field were coalesced, the oldest field dropped
+    assert stream.coalesced == 2 and stream.dropped == 1
+    assert len(stream) == 2
+
+    async def consume():
+        events = []
+        async for event in stream:
+            events.append(event)
+        return events
+
+    async def produce_and_consume():
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        # Edits from another thread wake up the consumer
+        thread = threading.Thread(target=lambda: setattr(level, "value", 4))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.01)
+        stream.close()
+        return await task
+
+    events = asyncio.run(produce_and_consume())
+    assert [(e.path, e.old, e.new) for e in events] == [
+        (("enabled",), False, True),
+        (("mode",), "fast", "slow"),
+        (("level",), 3, 4),
+    ]
+    snapshot = events[-1].model()
+    assert snapshot == w.value and snapshot is not w.value
+
+    dropping = w.changes(maxsize=2, overflow="drop_oldest")
+    for value in (5, 6, 7):
+        level.value = value
+    assert [dropping.get_nowait().new for _ in range(2)] == [6, 7]
+    assert dropping.dropped == 1
+
+    parent = pn.panel(ParentModel())
+    nested = parent.changes()
+    parent._widgets["child"]._widgets["regular_int"].value = 7
+    event = nested.get_nowait()
+    assert event.path == ("child", "regular_int")
+    assert (event.old, event.new) == (42, 7)
+    assert event.model().child.regular_int == 7
+
+
+class Shape(BaseModel):
+    name: str = "shape"
+    sides: int = 3
+
+
+class Polygon(Shape):
+    area: float = 1.0
+
+
+class Outline(Shape):
+    sides: int = Field(3, ge=3)
+    closed: bool = True
+
+
+def test_class_change_reuses_widgets():
+    w = pydantic_panel.PydanticModelEditor(class_=Polygon)
+    w.get_root(Document())
+    name, sides, area = (w._widgets[n] for n in ("name", "sides", "area"))
+    name.value = "triangle"
+    model_ids = {id(m) for m, _ in name._models.values()}
+
+    w.class_ = Outline
+    assert list(w._widgets) == ["name", "sides", "closed"]
+    assert w._widgets["name"] is name
+    assert name.value == "triangle"
+    assert {id(m) for m, _ in name._models.values()} == model_ids
+    # Changed constraints and new fields get new widgets
+    assert w._widgets["sides"] is not sides
+    assert w._widgets["closed"].value is True
+    # The value is rebuilt as the new class and validated on edit
+    assert isinstance(w.value, Outline)
+    assert (w.value.name, w.value.closed) == ("triangle", True)
+    w._widgets["closed"].value = False
+    assert isinstance(w.value, Outline) and w.value.closed is False
+    # Discarded widgets no longer validate into the editor
+    area.value = -1.0
+    assert not w.errors
+
+    w.class_ = Shape
+    assert list(w._widgets) == ["name", "sides"]
+    assert w._widgets["name"] is name
+    assert type(w.value) is Shape and w.value.name == "triangle"